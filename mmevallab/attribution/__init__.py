@@ -1,20 +1,28 @@
 """Data-diff attribution for slice deltas."""
 
 from mmevallab.attribution.delta import (
+    DeltaIndex,
+    Direction,
     ExampleDelta,
     SliceDelta,
     canonicalize_run_delta,
+    compute_delta_index,
     compute_example_deltas,
     compute_slice_deltas,
+    index_example_deltas,
 )
 from mmevallab.attribution.diff import compute_dataset_diff, save_diff_report
 
 __all__ = [
+    "DeltaIndex",
+    "Direction",
     "ExampleDelta",
     "SliceDelta",
     "canonicalize_run_delta",
     "compute_dataset_diff",
+    "compute_delta_index",
     "compute_example_deltas",
     "compute_slice_deltas",
+    "index_example_deltas",
     "save_diff_report",
 ]
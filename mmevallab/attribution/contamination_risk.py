@@ -6,6 +6,9 @@ from dataclasses import dataclass
 
 from mmevallab.contamination.tags import ContaminationLevel, ContaminationTag
 
+# Severity rank of each level, in declaration order
+_LEVEL_ORDER = {level: i for i, level in enumerate(ContaminationLevel)}
+
 
 @dataclass
 class ContaminationRisk:
@@ -23,32 +26,21 @@ def assess_diff_contamination(
     contamination_tags: dict[str, ContaminationTag],
 ) -> ContaminationRisk:
     """Assess contamination risk from dataset diff."""
-    added_contam = sum(
-        1
-        for eid in added_ids
-        if eid in contamination_tags
-        and contamination_tags[eid].level != ContaminationLevel.NONE
-    )
-    removed_contam = sum(
-        1
-        for eid in removed_ids
-        if eid in contamination_tags
-        and contamination_tags[eid].level != ContaminationLevel.NONE
-    )
-
-    # Determine overall risk
-    if added_contam > 0:
-        max_level = max(
-            (
-                contamination_tags[eid].level
-                for eid in added_ids
-                if eid in contamination_tags
-            ),
-            default=ContaminationLevel.NONE,
-            key=lambda x: list(ContaminationLevel).index(x),
-        )
-    else:
-        max_level = ContaminationLevel.NONE
+    added_contam = 0
+    max_level = ContaminationLevel.NONE
+    for eid in added_ids:
+        tag = contamination_tags.get(eid)
+        if tag is None or tag.level == ContaminationLevel.NONE:
+            continue
+        added_contam += 1
+        if _LEVEL_ORDER[tag.level] > _LEVEL_ORDER[max_level]:
+            max_level = tag.level
+
+    removed_contam = 0
+    for eid in removed_ids:
+        tag = contamination_tags.get(eid)
+        if tag is not None and tag.level != ContaminationLevel.NONE:
+            removed_contam += 1
 
     msg = f"Added {added_contam} contaminated, removed {removed_contam} contaminated"
 
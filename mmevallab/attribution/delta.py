@@ -2,13 +2,50 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
+import heapq
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from enum import IntEnum
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 
-@dataclass
+from mmevallab.core import jsonio
+
+
+class Direction(IntEnum):
+    """Direction of an example's outcome change between two runs."""
+
+    UNCHANGED = 0
+    IMPROVED = 1
+    REGRESSED = 2
+
+
+PREDICTIONS_FILE = "predictions.jsonl"
+OUTCOMES_SIDECAR = "predictions.outcomes.npz"
+
+# Outcome codes: 0 = missing/unscored, 1 = incorrect, 2 = correct
+_OUTCOMES: tuple[bool | None, ...] = (None, False, True)
+_OUTCOME_CODES: dict[bool | None, int] = {None: 0, False: 1, True: 2}
+_DIRECTIONS = tuple(Direction)
+
+# Direction lookup indexed by 3 * run1_code + run2_code
+_DIRECTION_TABLE = np.array(
+    [
+        Direction.UNCHANGED, Direction.UNCHANGED, Direction.UNCHANGED,
+        Direction.UNCHANGED, Direction.UNCHANGED, Direction.IMPROVED,
+        Direction.UNCHANGED, Direction.REGRESSED, Direction.UNCHANGED,
+    ],
+    dtype=np.int8,
+)  # fmt: skip
+
+
+@dataclass(slots=True)
 class ExampleDelta:
     """Delta for a single example between two runs."""
 
@@ -16,7 +53,7 @@ class ExampleDelta:
     run1_correct: bool | None
     run2_correct: bool | None
     changed: bool
-    direction: str  # "improved", "regressed", "unchanged"
+    direction: Direction
 
 
 @dataclass
@@ -31,97 +68,269 @@ class SliceDelta:
     run2_count: int
 
 
+@dataclass
+class DeltaIndex:
+    """Example deltas keyed by ID and partitioned by direction.
+
+    ``ids`` holds the example IDs in sorted order, with ``run1_codes`` and
+    ``run2_codes`` the matching int8 outcome codes for each run.
+    """
+
+    delta_by_id: dict[str, ExampleDelta]
+    improved_ids: list[str]
+    regressed_ids: list[str]
+    ids: np.ndarray
+    run1_codes: np.ndarray
+    run2_codes: np.ndarray
+
+    @property
+    def unchanged_count(self) -> int:
+        return len(self.delta_by_id) - len(self.improved_ids) - len(self.regressed_ids)
+
+
 def load_predictions(run_dir: Path | str) -> dict[str, dict[str, Any]]:
     """Load predictions from run directory."""
-    path = Path(run_dir) / "predictions.jsonl"
+    path = os.path.join(run_dir, PREDICTIONS_FILE)
     preds = {}
-    with open(path) as f:
+    with open(path, "rb", buffering=1 << 20) as f:
         for line in f:
-            p = json.loads(line)
+            p = jsonio.loads(line)
             preds[p["example_id"]] = p
     return preds
 
 
+def _source_stat(st: os.stat_result) -> list[int]:
+    """Size and mtime of a predictions file, as recorded in its sidecar."""
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_outcomes_sidecar(sidecar: str, source: str) -> tuple[np.ndarray, np.ndarray] | None:
+    """Read cached outcome arrays if they were built from the source as it is now.
+
+    The recorded source size and mtime must match exactly: a sidecar merely
+    newer than its source is not enough, as an mtime-preserving copy
+    (``cp -p``, ``rsync -a``) or a rewrite within the filesystem's timestamp
+    granularity would then be missed.
+    """
+    try:
+        current = _source_stat(os.stat(source))
+        with np.load(sidecar) as data:
+            if data["source_stat"].tolist() != current:
+                return None
+            return data["ids"], data["codes"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _write_outcomes_sidecar(
+    sidecar: str, ids: np.ndarray, codes: np.ndarray, source_stat: list[int]
+) -> None:
+    """Best-effort atomic write of outcome arrays; read-only run dirs are skipped."""
+    tmp = sidecar + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, ids=ids, codes=codes, source_stat=np.array(source_stat, dtype=np.int64))
+        os.replace(tmp, sidecar)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
+def load_outcomes(run_dir: Path | str) -> tuple[np.ndarray, np.ndarray]:
+    """Load per-example correctness from a run directory as parallel arrays.
+
+    The first load writes a columnar ``predictions.outcomes.npz`` sidecar
+    next to ``predictions.jsonl``; later loads read it instead of
+    re-parsing the JSONL while the predictions file keeps the size and
+    mtime it had when the sidecar was built.
+
+    Returns:
+        Tuple of (sorted example IDs, int8 outcome codes in the same order)
+    """
+    path = os.path.join(run_dir, PREDICTIONS_FILE)
+    sidecar = os.path.join(run_dir, OUTCOMES_SIDECAR)
+    cached = _read_outcomes_sidecar(sidecar, path)
+    if cached is not None:
+        return cached
+
+    outcomes: dict[str, int] = {}
+    with open(path, "rb", buffering=1 << 20) as f:
+        # Stat before parsing, so a write during the parse invalidates the sidecar
+        source_stat = _source_stat(os.fstat(f.fileno()))
+        for line in f:
+            p = jsonio.loads(line)
+            outcomes[p["example_id"]] = _OUTCOME_CODES.get(p.get("is_correct"), 0)
+    # Evaluators usually emit IDs in order, making this sort a linear scan
+    sorted_ids = sorted(outcomes)
+    ids = np.array(sorted_ids, dtype=np.str_)
+    codes = np.fromiter((outcomes[eid] for eid in sorted_ids), dtype=np.int8, count=len(sorted_ids))
+    _write_outcomes_sidecar(sidecar, ids, codes, source_stat)
+    return ids, codes
+
+
+def _merge_outcomes(
+    ids1: np.ndarray, codes1: np.ndarray, ids2: np.ndarray, codes2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge-join two sorted outcome streams onto their sorted ID union.
+
+    IDs absent from one side get outcome code 0 on that side.
+    """
+    ids = np.union1d(ids1, ids2)
+    c1 = np.zeros(len(ids), dtype=np.int8)
+    c2 = np.zeros(len(ids), dtype=np.int8)
+    c1[np.searchsorted(ids, ids1)] = codes1
+    c2[np.searchsorted(ids, ids2)] = codes2
+    return ids, c1, c2
+
+
+def compute_delta_index(
+    run1_dir: Path | str,
+    run2_dir: Path | str,
+) -> DeltaIndex:
+    """Compute per-example deltas between two runs, indexed for reuse.
+
+    Outcomes are encoded as small ints so the direction of every example is
+    a single table lookup on the (run1, run2) code pair, with no branching.
+    The direction partition and outcome arrays come straight from that
+    vectorized pass, so downstream slice and summary steps never rescan.
+    """
+    ids, c1, c2 = _merge_outcomes(*load_outcomes(run1_dir), *load_outcomes(run2_dir))
+
+    changed = c1 != c2
+    directions = _DIRECTION_TABLE[3 * c1 + c2]
+
+    delta_by_id = {
+        eid: ExampleDelta(
+            example_id=eid,
+            run1_correct=_OUTCOMES[a],
+            run2_correct=_OUTCOMES[b],
+            changed=ch,
+            direction=_DIRECTIONS[di],
+        )
+        for eid, a, b, ch, di in zip(
+            ids.tolist(), c1.tolist(), c2.tolist(), changed.tolist(), directions.tolist()
+        )
+    }
+    return DeltaIndex(
+        delta_by_id=delta_by_id,
+        improved_ids=ids[directions == Direction.IMPROVED].tolist(),
+        regressed_ids=ids[directions == Direction.REGRESSED].tolist(),
+        ids=ids,
+        run1_codes=c1,
+        run2_codes=c2,
+    )
+
+
 def compute_example_deltas(
     run1_dir: Path | str,
     run2_dir: Path | str,
 ) -> list[ExampleDelta]:
-    """Compute per-example deltas between two runs."""
-    preds1 = load_predictions(run1_dir)
-    preds2 = load_predictions(run2_dir)
-
-    all_ids = set(preds1.keys()) | set(preds2.keys())
-    deltas = []
-
-    for eid in all_ids:
-        p1 = preds1.get(eid, {})
-        p2 = preds2.get(eid, {})
-
-        c1 = p1.get("is_correct")
-        c2 = p2.get("is_correct")
-
-        if c1 is False and c2 is True:
-            direction = "improved"
-        elif c1 is True and c2 is False:
-            direction = "regressed"
-        else:
-            direction = "unchanged"
-
-        deltas.append(
-            ExampleDelta(
-                example_id=eid,
-                run1_correct=c1,
-                run2_correct=c2,
-                changed=c1 != c2,
-                direction=direction,
-            )
-        )
+    """Compute per-example deltas between two runs, in example-ID order."""
+    return list(compute_delta_index(run1_dir, run2_dir).delta_by_id.values())
+
+
+def index_example_deltas(example_deltas: list[ExampleDelta]) -> DeltaIndex:
+    """Build the ID map and direction partition in a single pass."""
+    delta_by_id: dict[str, ExampleDelta] = {}
+    improved_ids: list[str] = []
+    regressed_ids: list[str] = []
+    for d in example_deltas:
+        delta_by_id[d.example_id] = d
+        if d.direction == Direction.IMPROVED:
+            improved_ids.append(d.example_id)
+        elif d.direction == Direction.REGRESSED:
+            regressed_ids.append(d.example_id)
+    ids = sorted(delta_by_id)
+    run1_codes = np.fromiter(
+        (_OUTCOME_CODES[delta_by_id[eid].run1_correct] for eid in ids),
+        dtype=np.int8,
+        count=len(ids),
+    )
+    run2_codes = np.fromiter(
+        (_OUTCOME_CODES[delta_by_id[eid].run2_correct] for eid in ids),
+        dtype=np.int8,
+        count=len(ids),
+    )
+    return DeltaIndex(
+        delta_by_id=delta_by_id,
+        improved_ids=improved_ids,
+        regressed_ids=regressed_ids,
+        ids=np.array(ids, dtype=np.str_),
+        run1_codes=run1_codes,
+        run2_codes=run2_codes,
+    )
+
+
+def _slice_delta(slice_name: str, example_ids: list[str], index: DeltaIndex) -> SliceDelta:
+    """Aggregate run accuracies for one slice with array reductions."""
+    query = np.asarray(example_ids, dtype=np.str_)
+    if len(index.ids) and len(query):
+        pos = np.minimum(np.searchsorted(index.ids, query), len(index.ids) - 1)
+        pos = pos[index.ids[pos] == query]
+    else:
+        pos = np.empty(0, dtype=np.intp)
+    # One counting pass yields the 3x3 (run1, run2) outcome contingency table
+    pairs = 3 * index.run1_codes[pos] + index.run2_codes[pos]
+    counts = np.bincount(pairs, minlength=9).reshape(3, 3)
+
+    r1_total = int(counts[1:].sum())
+    r2_total = int(counts[:, 1:].sum())
+    r1_acc = int(counts[2].sum()) / r1_total if r1_total > 0 else 0
+    r2_acc = int(counts[:, 2].sum()) / r2_total if r2_total > 0 else 0
+
+    return SliceDelta(
+        slice_name=slice_name,
+        run1_accuracy=r1_acc,
+        run2_accuracy=r2_acc,
+        delta=r2_acc - r1_acc,
+        run1_count=r1_total,
+        run2_count=r2_total,
+    )
 
-    return deltas
+
+_by_delta = attrgetter("delta")
 
 
 def compute_slice_deltas(
-    example_deltas: list[ExampleDelta],
+    example_deltas: list[ExampleDelta] | DeltaIndex,
     slice_assignments: dict[str, list[str]],  # slice_name -> example_ids
+    top_k: int | None = None,
+    max_workers: int | None = None,
+    sort: bool = True,
 ) -> list[SliceDelta]:
-    """Compute per-slice deltas from example deltas."""
-    delta_map = {d.example_id: d for d in example_deltas}
-    slice_deltas = []
-
-    for slice_name, example_ids in slice_assignments.items():
-        r1_correct = 0
-        r1_total = 0
-        r2_correct = 0
-        r2_total = 0
-
-        for eid in example_ids:
-            d = delta_map.get(eid)
-            if not d:
-                continue
-            if d.run1_correct is not None:
-                r1_total += 1
-                if d.run1_correct:
-                    r1_correct += 1
-            if d.run2_correct is not None:
-                r2_total += 1
-                if d.run2_correct:
-                    r2_correct += 1
-
-        r1_acc = r1_correct / r1_total if r1_total > 0 else 0
-        r2_acc = r2_correct / r2_total if r2_total > 0 else 0
-
-        slice_deltas.append(
-            SliceDelta(
-                slice_name=slice_name,
-                run1_accuracy=r1_acc,
-                run2_accuracy=r2_acc,
-                delta=r2_acc - r1_acc,
-                run1_count=r1_total,
-                run2_count=r2_total,
-            )
-        )
+    """Compute per-slice deltas from example deltas.
+
+    Pass a ``DeltaIndex`` (from ``compute_delta_index``) when computing
+    several slice groupings over the same deltas to avoid rebuilding the
+    index on every call.
+
+    Args:
+        example_deltas: Example deltas, or a prebuilt index over them
+        slice_assignments: Mapping of slice name to member example IDs
+        top_k: If set, return only the k most regressed slices
+        max_workers: If set, aggregate slices on a thread pool of this size
+        sort: Sort by delta (most regressed first); pass False to keep
+            ``slice_assignments`` order when the caller re-sorts anyway
+    """
+    if isinstance(example_deltas, DeltaIndex):
+        index = example_deltas
+    else:
+        index = index_example_deltas(example_deltas)
 
-    return sorted(slice_deltas, key=lambda x: x.delta)
+    def build(item: tuple[str, list[str]]) -> SliceDelta:
+        return _slice_delta(item[0], item[1], index)
+
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            slice_deltas: Iterable[SliceDelta] = list(pool.map(build, slice_assignments.items()))
+    else:
+        slice_deltas = map(build, slice_assignments.items())
+
+    if top_k is not None:
+        return heapq.nsmallest(top_k, slice_deltas, key=_by_delta)
+    if not sort:
+        return list(slice_deltas)
+    return sorted(slice_deltas, key=_by_delta)
 
 
 def canonicalize_run_delta(
@@ -129,20 +338,18 @@ def canonicalize_run_delta(
     run2_dir: Path | str,
 ) -> dict[str, Any]:
     """Create canonical delta object for attribution."""
-    example_deltas = compute_example_deltas(run1_dir, run2_dir)
-
-    improved = [d for d in example_deltas if d.direction == "improved"]
-    regressed = [d for d in example_deltas if d.direction == "regressed"]
-    unchanged = [d for d in example_deltas if d.direction == "unchanged"]
+    index = compute_delta_index(run1_dir, run2_dir)
+    improved_ids = index.improved_ids
+    regressed_ids = index.regressed_ids
 
     return {
         "run1": str(run1_dir),
         "run2": str(run2_dir),
-        "total_examples": len(example_deltas),
-        "improved": len(improved),
-        "regressed": len(regressed),
-        "unchanged": len(unchanged),
-        "net_change": len(improved) - len(regressed),
-        "improved_ids": [d.example_id for d in improved],
-        "regressed_ids": [d.example_id for d in regressed],
+        "total_examples": len(index.delta_by_id),
+        "improved": len(improved_ids),
+        "regressed": len(regressed_ids),
+        "unchanged": index.unchanged_count,
+        "net_change": len(improved_ids) - len(regressed_ids),
+        "improved_ids": improved_ids,
+        "regressed_ids": regressed_ids,
     }
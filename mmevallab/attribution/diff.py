@@ -2,12 +2,37 @@
 
 from __future__ import annotations
 
-import json
-from collections import Counter
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from mmevallab.contamination.manifest import load_manifest
+from mmevallab.core import jsonio
+
+
+@dataclass(slots=True)
+class _DiffRecord:
+    """Fields of a manifest sample needed for diffing."""
+
+    modality: str
+    source: str | None
+    text_hash: int
+
+
+def _text_hash(text: str | None) -> int:
+    """64-bit digest of sample text; a missing text hashes like an empty one."""
+    digest = hashlib.blake2b((text or "").encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _load_diff_records(path: Path | str) -> dict[str, _DiffRecord]:
+    """Load a manifest keeping only a text digest instead of the full text."""
+    return {
+        s.sample_id: _DiffRecord(s.modality, s.source, _text_hash(s.text))
+        for s in load_manifest(path)
+    }
 
 
 def compute_dataset_diff(
@@ -19,36 +44,29 @@ def compute_dataset_diff(
     Returns:
         Dict with added, removed, and modified samples
     """
-    old_samples = {s.sample_id: s for s in load_manifest(old_manifest)}
-    new_samples = {s.sample_id: s for s in load_manifest(new_manifest)}
-
-    old_ids = set(old_samples.keys())
-    new_ids = set(new_samples.keys())
-
-    added_ids = new_ids - old_ids
-    removed_ids = old_ids - new_ids
-    common_ids = old_ids & new_ids
-
-    # Check for modifications in common samples
-    modified_ids = []
-    for sid in common_ids:
-        old_text = old_samples[sid].text or ""
-        new_text = new_samples[sid].text or ""
-        if old_text != new_text:
-            modified_ids.append(sid)
+    old_samples = _load_diff_records(old_manifest)
+    new_samples = _load_diff_records(new_manifest)
 
-    # Group by modality/source
-    added_by_modality: Counter[str] = Counter()
-    added_by_source: Counter[str] = Counter()
-    for sid in added_ids:
-        s = new_samples[sid]
-        added_by_modality[s.modality] += 1
-        added_by_source[s.source or "unknown"] += 1
+    # Classify every new sample in one scan, counting additions as we go
+    added_ids: list[str] = []
+    modified_ids: list[str] = []
+    added_by_modality: defaultdict[str, int] = defaultdict(int)
+    added_by_source: defaultdict[str, int] = defaultdict(int)
+    for sid, s in new_samples.items():
+        old = old_samples.get(sid)
+        if old is None:
+            added_ids.append(sid)
+            added_by_modality[s.modality] += 1
+            added_by_source[s.source or "unknown"] += 1
+        elif old.text_hash != s.text_hash:
+            modified_ids.append(sid)
 
-    removed_by_modality: Counter[str] = Counter()
-    for sid in removed_ids:
-        s = old_samples[sid]
-        removed_by_modality[s.modality] += 1
+    removed_ids: list[str] = []
+    removed_by_modality: defaultdict[str, int] = defaultdict(int)
+    for sid, s in old_samples.items():
+        if sid not in new_samples:
+            removed_ids.append(sid)
+            removed_by_modality[s.modality] += 1
 
     return {
         "old_count": len(old_samples),
@@ -56,8 +74,8 @@ def compute_dataset_diff(
         "added": len(added_ids),
         "removed": len(removed_ids),
         "modified": len(modified_ids),
-        "added_ids": list(added_ids)[:1000],
-        "removed_ids": list(removed_ids)[:1000],
+        "added_ids": added_ids[:1000],
+        "removed_ids": removed_ids[:1000],
         "modified_ids": modified_ids[:1000],
         "added_by_modality": dict(added_by_modality),
         "added_by_source": dict(added_by_source),
@@ -68,5 +86,5 @@ def compute_dataset_diff(
 def save_diff_report(diff: dict[str, Any], output_path: Path | str) -> None:
     """Save diff report to JSON file."""
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(diff, f, indent=2)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        jsonio.dump(diff, f, indent=True)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from mmevallab.eval.failure_modes import FailureLabel, FailureMode
 
+_MODES = tuple(FailureMode)
+_MODE_LABEL = {mode: mode.label for mode in _MODES}
+
 
 @dataclass
 class FailureModeDelta:
@@ -20,39 +25,44 @@ class FailureModeDelta:
     delta_pct: float
 
 
+def _count_modes(labels: dict[str, FailureLabel]) -> np.ndarray:
+    """Count labels per failure mode, indexed by mode ordinal."""
+    ordinals = np.fromiter(
+        (label.mode for label in labels.values()), dtype=np.int8, count=len(labels)
+    )
+    return np.bincount(ordinals, minlength=len(_MODES))
+
+
 def compute_failure_mode_deltas(
     baseline_labels: dict[str, FailureLabel],
     current_labels: dict[str, FailureLabel],
 ) -> list[FailureModeDelta]:
     """Compute changes in failure mode distribution."""
-    baseline_counts: dict[FailureMode, int] = defaultdict(int)
-    current_counts: dict[FailureMode, int] = defaultdict(int)
+    base = _count_modes(baseline_labels)
+    curr = _count_modes(current_labels)
+    delta = curr - base
 
-    for label in baseline_labels.values():
-        baseline_counts[label.mode] += 1
-    for label in current_labels.values():
-        current_counts[label.mode] += 1
+    # Only modes observed in either run, largest absolute change first
+    observed = np.flatnonzero((base > 0) | (curr > 0))
+    order = observed[np.argsort(-np.abs(delta[observed]), kind="stable")]
 
     deltas = []
-    all_modes = set(baseline_counts.keys()) | set(current_counts.keys())
-
-    for mode in all_modes:
-        base = baseline_counts[mode]
-        curr = current_counts[mode]
-        delta = curr - base
-        delta_pct = delta / base if base > 0 else float("inf") if delta > 0 else 0.0
+    for i in order.tolist():
+        b = int(base[i])
+        d = int(delta[i])
+        delta_pct = d / b if b > 0 else float("inf") if d > 0 else 0.0
 
         deltas.append(
             FailureModeDelta(
-                mode=mode,
-                baseline_count=base,
-                current_count=curr,
-                delta=delta,
+                mode=_MODES[i],
+                baseline_count=b,
+                current_count=int(curr[i]),
+                delta=d,
                 delta_pct=delta_pct,
             )
         )
 
-    return sorted(deltas, key=lambda x: abs(x.delta), reverse=True)
+    return deltas
 
 
 def correlate_with_diff(
@@ -63,22 +73,19 @@ def correlate_with_diff(
 ) -> dict[str, Any]:
     """Correlate failure mode changes with dataset diff."""
     # Count failure modes in added examples
-    added_modes: dict[FailureMode, int] = defaultdict(int)
-    for eid in added_ids:
-        if eid in current_labels:
-            added_modes[current_labels[eid].mode] += 1
+    added_modes = Counter(current_labels[eid].mode for eid in added_ids if eid in current_labels)
 
     return {
         "failure_deltas": [
             {
-                "mode": d.mode.value,
+                "mode": _MODE_LABEL[d.mode],
                 "baseline": d.baseline_count,
                 "current": d.current_count,
                 "delta": d.delta,
             }
             for d in failure_deltas
         ],
-        "added_by_mode": {m.value: c for m, c in added_modes.items()},
+        "added_by_mode": {_MODE_LABEL[m]: c for m, c in added_modes.items()},
         "total_added": len(added_ids),
         "total_removed": len(removed_ids),
     }
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 
@@ -33,6 +35,9 @@ def compute_tracin_influence(
     return 0.0
 
 
+_by_influence = attrgetter("influence")
+
+
 def rank_influential_examples(
     test_id: str,
     train_influences: list[InfluenceScore],
@@ -48,6 +53,9 @@ def rank_influential_examples(
         proponents: If True, return most helpful (positive influence)
                    If False, return most harmful (negative influence)
     """
-    filtered = [s for s in train_influences if s.test_id == test_id]
-    filtered.sort(key=lambda x: x.influence, reverse=proponents)
-    return filtered[:top_k]
+    select = heapq.nlargest if proponents else heapq.nsmallest
+    return select(
+        top_k,
+        (s for s in train_influences if s.test_id == test_id),
+        key=_by_influence,
+    )
@@ -7,6 +7,9 @@ from typing import Any
 
 from mmevallab.attribution.similarity import Attribution
 
+# Number of offending pairs kept in a failed check's details
+_MAX_REPORTED_VIOLATIONS = 10
+
 
 @dataclass
 class SanityCheckResult:
@@ -23,18 +26,21 @@ def check_self_attribution(
     test_ids: set[str],
 ) -> SanityCheckResult:
     """Check that test examples don't attribute to themselves."""
-    violations = []
+    count = 0
+    sample: list[tuple[str, str]] = []
     for test_id, attrs in attributions.items():
         for attr in attrs:
             if attr.train_id in test_ids:
-                violations.append((test_id, attr.train_id))
+                count += 1
+                if len(sample) < _MAX_REPORTED_VIOLATIONS:
+                    sample.append((test_id, attr.train_id))
 
-    msg = f"Found {len(violations)} self-attributions" if violations else "No self-attributions"
+    msg = f"Found {count} self-attributions" if count else "No self-attributions"
     return SanityCheckResult(
         check_name="self_attribution",
-        passed=len(violations) == 0,
+        passed=count == 0,
         message=msg,
-        details={"violations": violations[:10]} if violations else None,
+        details={"violations": sample} if count else None,
     )
 
 
@@ -42,9 +48,12 @@ def check_attribution_coverage(
     attributions: dict[str, list[Attribution]],
     min_coverage: float = 0.5,
 ) -> SanityCheckResult:
-    """Check that enough test examples have attributions."""
+    """Check that enough test examples have attributions.
+
+    An empty (or None) attribution list counts as no attribution.
+    """
     total = len(attributions)
-    with_attrs = sum(1 for attrs in attributions.values() if attrs)
+    with_attrs = sum(map(bool, attributions.values()))
     coverage = with_attrs / total if total > 0 else 0.0
 
     return SanityCheckResult(
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+# Upper bound on similarity-matrix cells held in memory per test block
+_BLOCK_CELLS = 1 << 22
+
 
 @dataclass
 class Attribution:
@@ -16,15 +22,68 @@ class Attribution:
     method: str
 
 
+def _tokenize(text: str) -> frozenset[str]:
+    """Lowercased, deduplicated whitespace tokens."""
+    return frozenset(text.lower().split())
+
+
+def _jaccard(tokens1: frozenset[str], tokens2: frozenset[str]) -> float:
+    """Jaccard similarity of two pre-tokenized texts."""
+    if not tokens1 or not tokens2:
+        return 0.0
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
+
+
 def compute_text_similarity(text1: str, text2: str) -> float:
     """Compute simple text similarity (Jaccard on words)."""
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
-    if not words1 or not words2:
-        return 0.0
-    intersection = len(words1 & words2)
-    union = len(words1 | words2)
-    return intersection / union
+    return _jaccard(_tokenize(text1), _tokenize(text2))
+
+
+def _build_postings(train_tokens: list[frozenset[str]]) -> dict[str, np.ndarray]:
+    """Inverted index mapping each token to the training rows containing it."""
+    postings: dict[str, list[int]] = defaultdict(list)
+    for row, tokens in enumerate(train_tokens):
+        for token in tokens:
+            postings[token].append(row)
+    return {token: np.array(rows, dtype=np.intp) for token, rows in postings.items()}
+
+
+def _jaccard_block(
+    test_tokens: list[frozenset[str]],
+    postings: dict[str, np.ndarray],
+    train_sizes: np.ndarray,
+) -> np.ndarray:
+    """Jaccard similarity matrix of a block of test texts against every training row."""
+    n_train = len(train_sizes)
+    hits = [
+        postings[token] + row * n_train
+        for row, tokens in enumerate(test_tokens)
+        for token in tokens
+        if token in postings
+    ]
+    shape = (len(test_tokens), n_train)
+    if not hits:
+        return np.zeros(shape)
+    intersection = np.bincount(np.concatenate(hits), minlength=shape[0] * n_train).reshape(shape)
+    test_sizes = np.fromiter(map(len, test_tokens), dtype=np.intp, count=len(test_tokens))
+    union = test_sizes[:, None] + train_sizes[None, :] - intersection
+    similarity: np.ndarray = np.divide(intersection, union, out=np.zeros(shape), where=union > 0)
+    return similarity
+
+
+def _top_k_rows(sims: np.ndarray, top_k: int, threshold: float) -> list[list[int]]:
+    """Column indices of the top-k scores at or above threshold in each row."""
+    if top_k <= 0 or sims.shape[1] == 0:
+        return [[] for _ in range(sims.shape[0])]
+    k = min(top_k, sims.shape[1])
+    # k-th best score per row; every column reaching it (ties included) is a candidate
+    cutoff = np.maximum(-np.partition(-sims, k - 1, axis=1)[:, k - 1], threshold)
+    rows = []
+    for row, floor in zip(sims, cutoff):
+        candidates = np.flatnonzero(row >= floor)
+        rows.append(candidates[np.argsort(-row[candidates], kind="stable")][:k].tolist())
+    return rows
 
 
 def attribute_by_similarity(
@@ -34,25 +93,36 @@ def attribute_by_similarity(
     top_k: int = 5,
     threshold: float = 0.3,
 ) -> dict[str, list[Attribution]]:
-    """Attribute test examples to training data by text similarity."""
+    """Attribute test examples to training data by text similarity.
+
+    Texts are tokenized once into column-wise arrays. Test examples are
+    scored in blocks: shared-token counts for a whole block against every
+    training row come from one bincount over the posting lists, and the
+    top-k per row is cut off at its k-th best score from np.partition.
+    """
     attributions: dict[str, list[Attribution]] = {}
 
-    for test in test_examples:
-        test_id = test.get("example_id", test.get("id", ""))
-        test_text = test.get(text_field, "")
-
-        scores = []
-        for train in train_examples:
-            train_id = train.get("example_id", train.get("id", ""))
-            train_text = train.get(text_field, "")
-            sim = compute_text_similarity(test_text, train_text)
-            if sim >= threshold:
-                scores.append((train_id, sim))
-
-        scores.sort(key=lambda x: -x[1])
-        attributions[test_id] = [
-            Attribution(test_id=test_id, train_id=tid, similarity=sim, method="jaccard")
-            for tid, sim in scores[:top_k]
-        ]
+    train_ids = [train.get("example_id", train.get("id", "")) for train in train_examples]
+    train_tokens = [_tokenize(train.get(text_field, "")) for train in train_examples]
+    train_sizes = np.fromiter(map(len, train_tokens), dtype=np.intp, count=len(train_tokens))
+    postings = _build_postings(train_tokens)
+
+    test_ids = [test.get("example_id", test.get("id", "")) for test in test_examples]
+    test_tokens = [_tokenize(test.get(text_field, "")) for test in test_examples]
+
+    block = max(1, _BLOCK_CELLS // max(1, len(train_ids)))
+    for start in range(0, len(test_ids), block):
+        sims = _jaccard_block(test_tokens[start : start + block], postings, train_sizes)
+        for offset, rows in enumerate(_top_k_rows(sims, top_k, threshold)):
+            test_id = test_ids[start + offset]
+            attributions[test_id] = [
+                Attribution(
+                    test_id=test_id,
+                    train_id=train_ids[row],
+                    similarity=float(sims[offset, row]),
+                    method="jaccard",
+                )
+                for row in rows
+            ]
 
     return attributions
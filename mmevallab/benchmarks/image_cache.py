@@ -0,0 +1,62 @@
+"""On-disk encodings for cached rendered pages and video frames."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+# Cache format -> file suffix
+CACHE_FORMATS = {"png": ".png", "jpeg": ".jpg", "npy": ".npy"}
+
+
+def check_cache_format(cache_format: str) -> str:
+    """Validate a cache format name."""
+    if cache_format not in CACHE_FORMATS:
+        raise ValueError(f"Unknown cache format: {cache_format}. Valid: {list(CACHE_FORMATS)}")
+    return cache_format
+
+
+def cache_path(stem: Path, cache_format: str) -> Path:
+    """Path of a cached image given its stem and format."""
+    return stem.with_name(stem.name + CACHE_FORMATS[cache_format])
+
+
+def save_image(img: "Image.Image | np.ndarray", path: Path, cache_format: str) -> None:
+    """Write an image in the given cache format.
+
+    ``jpeg`` is lossy but fast to encode and decode (quality 90, no chroma
+    subsampling); ``npy`` stores raw pixels for memory-mapped loading. An
+    (H, W, C) uint8 array may be passed instead of an image; ``npy`` then
+    writes it without a round trip through PIL.
+    """
+    if cache_format == "npy":
+        import numpy as np
+
+        np.save(path, np.asarray(img))
+        return
+
+    from PIL import Image
+
+    if not isinstance(img, Image.Image):
+        img = Image.fromarray(img)
+    if cache_format == "jpeg":
+        img.save(path, "JPEG", quality=90, subsampling=0)
+    else:
+        img.save(path, "PNG")
+
+
+def load_image(path: Path, cache_format: str) -> "Image.Image":
+    """Read and decode an image written by save_image."""
+    from PIL import Image
+
+    if cache_format == "npy":
+        import numpy as np
+
+        return Image.fromarray(np.load(path, mmap_mode="r"))
+    img = Image.open(path)
+    img.load()
+    return img
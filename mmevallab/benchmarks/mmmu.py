@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
+import numpy as np
+
 from mmevallab.core.datamodel import Example, MediaRef, Prediction
 from mmevallab.core.registry import Benchmark, register_benchmark
 
@@ -53,29 +57,81 @@ SUBJECT_TO_DISCIPLINE = {
 }
 
 
-def _load_mmmu_dataset(split: str) -> Any:
-    """Load MMMU dataset from HuggingFace."""
+_IMG_KEYS = tuple(f"image_{i}" for i in range(1, 8))
+_OPT_KEYS = ("A", "B", "C", "D", "E", "F", "G")
+# Concurrent subject downloads in _load_mmmu_dataset
+_LOAD_WORKERS = 8
+
+
+def _load_mmmu_dataset(split: str) -> list[Any]:
+    """Load MMMU subject datasets from HuggingFace.
+
+    Returns the per-subject ``Dataset`` handles rather than materialized rows,
+    so images are only decoded when an example's media is loaded.
+    """
     try:
         from datasets import load_dataset
     except ImportError as e:
         raise ImportError("Install datasets: pip install datasets") from e
 
-    # MMMU has subject-specific configs
-    all_data = []
-    for subject in MMMU_SUBJECTS:
+    def load_subject(subject: str) -> Any:
         try:
-            ds = load_dataset("MMMU/MMMU", subject, split=split, trust_remote_code=True)
-            all_data.extend(ds)
+            return load_dataset("MMMU/MMMU", subject, split=split, trust_remote_code=True)
         except Exception:
             # Some subjects may not exist in all splits
-            continue
-    return all_data
-
-
-def _compute_content_hash(data: list[Any]) -> str:
-    """Compute hash of dataset content for reproducibility."""
-    ids = sorted(item.get("id", str(i)) for i, item in enumerate(data))
-    return hashlib.sha256("|".join(ids).encode()).hexdigest()[:16]
+            return None
+
+    # MMMU has subject-specific configs; fetching them is IO-bound, so use threads.
+    # map() keeps subject order stable.
+    with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+        return [ds for ds in pool.map(load_subject, MMMU_SUBJECTS) if ds is not None]
+
+
+def _iter_rows(datasets: list[Any]) -> Iterator[tuple[dict[str, Any], int, dict[str, Any]]]:
+    """Yield (image column views, row index, row) with image columns left undecoded.
+
+    The views map each image column to a single-column view of its dataset,
+    so indexing one decodes only that image rather than every image in the row.
+    """
+    from datasets import Image
+
+    for ds in datasets:
+        view = ds
+        image_columns = {}
+        for img_key in _IMG_KEYS:
+            if img_key in ds.column_names:
+                view = view.cast_column(img_key, Image(decode=False))
+                image_columns[img_key] = ds.select_columns([img_key])
+        for row, item in enumerate(view):
+            yield image_columns, row, item
+
+
+def _load_image(column: Any, row: int, img_key: str) -> Any:
+    """Decode a single image from a single-column dataset view."""
+    return column[row][img_key]
+
+
+def _compute_content_hash(datasets: list[Any]) -> str:
+    """Compute hash of dataset content for reproducibility.
+
+    Reads only the ``id`` column of each ``Dataset`` handle, so no images are
+    decoded; rows without an ID contribute their overall index.
+    """
+    ids: list[bytes] = []
+    for ds in datasets:
+        if "id" in ds.column_names:
+            ids.extend(example_id.encode() for example_id in ds["id"])
+        else:
+            offset = len(ids)
+            ids.extend(str(offset + i).encode() for i in range(len(ds)))
+    # UTF-8 byte order matches code point order, so sorting bytes sorts the IDs
+    ids.sort()
+    h = hashlib.sha256()
+    for n, example_id in enumerate(ids):
+        if n:
+            h.update(b"|")
+        h.update(example_id)
+    return h.hexdigest()[:16]
 
 
 @register_benchmark("mmmu")
@@ -99,26 +155,25 @@ class MMMUBenchmark(Benchmark):
         data = _load_mmmu_dataset(split)
         limit = kwargs.get("limit")
 
-        for i, item in enumerate(data):
+        for i, (image_columns, row, item) in enumerate(_iter_rows(data)):
             if limit and i >= limit:
                 break
 
             example_id = item.get("id", f"mmmu_{split}_{i}")
 
-            # Collect images
-            media = []
-            img_keys = [f"image_{i}" for i in range(1, 8)]
-            for img_key in img_keys:
-                img = item.get(img_key)
-                if img is not None:
-                    media.append(MediaRef(type="image", path=None))
+            # Images are decoded on demand via MediaRef.load()
+            media = [
+                MediaRef(
+                    type="image",
+                    path=None,
+                    loader=partial(_load_image, image_columns[img_key], row, img_key),
+                )
+                for img_key in _IMG_KEYS
+                if item.get(img_key) is not None
+            ]
 
             # Build inputs
-            options = []
-            for opt_key in ["A", "B", "C", "D", "E", "F", "G"]:
-                opt = item.get(opt_key)
-                if opt:
-                    options.append(f"{opt_key}. {opt}")
+            options = [f"{key}. {item[key]}" for key in _OPT_KEYS if item.get(key)]
 
             inputs = {
                 "question": item.get("question", ""),
@@ -126,13 +181,6 @@ class MMMUBenchmark(Benchmark):
                 "question_type": item.get("question_type", "multiple-choice"),
             }
 
-            # Store raw images in metadata for later access
-            raw_images = {}
-            for img_key in img_keys:
-                img = item.get(img_key)
-                if img is not None:
-                    raw_images[img_key] = img
-
             subject = item.get("subject", "")
             discipline = SUBJECT_TO_DISCIPLINE.get(subject, "Unknown")
 
@@ -144,7 +192,6 @@ class MMMUBenchmark(Benchmark):
                 "image_type": item.get("image_type", ""),
                 "num_images": len(media),
                 "split": split,
-                "_raw_images": raw_images,
             }
 
             # Ground truth (None for test split)
@@ -174,3 +221,33 @@ class MMMUBenchmark(Benchmark):
             "ground_truth": gt,
             "predicted": pred,
         }
+
+    def score_batch(
+        self, examples: Sequence[Example], predictions: Sequence[Prediction]
+    ) -> list[dict[str, Any]]:
+        """Score predictions in bulk with a vectorized answer comparison.
+
+        Answers are normalized with str methods, as in ``score``, and held in
+        object arrays: fixed-width ``<U`` arrays would truncate case mappings
+        that lengthen a string (``"ß"`` -> ``"SS"``) and drop trailing NULs.
+        """
+        if not examples:
+            return []
+        gt = [(e.ground_truth or "").strip().upper() for e in examples]
+        pred = [(p.extracted_answer or "").strip().upper() for p in predictions]
+        correct = (np.array(gt, dtype=object) == np.array(pred, dtype=object)).tolist()
+
+        results: list[dict[str, Any]] = []
+        for example, g, p, is_correct in zip(examples, gt, pred, correct):
+            if example.ground_truth is None:
+                results.append({"is_correct": None, "accuracy": None})
+                continue
+            results.append(
+                {
+                    "is_correct": is_correct,
+                    "accuracy": 1.0 if is_correct else 0.0,
+                    "ground_truth": g,
+                    "predicted": p,
+                }
+            )
+        return results
@@ -6,6 +6,12 @@ import json
 from pathlib import Path
 from typing import Any
 
+from mmevallab.core import jsonio
+
+_VALID_ANSWERS = frozenset("ABCDE")
+# Per-answer errors reported by validate_submission before summarizing the rest
+_MAX_ERRORS = 100
+
 
 def export_mmmu_submission(
     predictions: list[dict[str, Any]],
@@ -21,7 +27,7 @@ def export_mmmu_submission(
         example_id = p.get("example_id", "")
         answer = p.get("extracted_answer", "")
         # MMMU expects single letter answers
-        if answer and answer[0].upper() in "ABCDE":
+        if answer and answer[0].upper() in _VALID_ANSWERS:
             submission[example_id] = answer[0].upper()
         else:
             submission[example_id] = answer
@@ -32,8 +38,7 @@ def export_mmmu_submission(
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2)
+    output_path.write_bytes(jsonio.dumps(output, indent=True))
 
     return output_path
 
@@ -43,8 +48,7 @@ def validate_submission(submission_path: Path) -> tuple[bool, list[str]]:
     errors = []
 
     try:
-        with open(submission_path) as f:
-            data = json.load(f)
+        data = jsonio.loads(submission_path.read_bytes())
     except json.JSONDecodeError as e:
         return False, [f"Invalid JSON: {e}"]
 
@@ -53,10 +57,19 @@ def validate_submission(submission_path: Path) -> tuple[bool, list[str]]:
         return False, errors
 
     preds = data["predictions"]
+    invalid = 0
     for eid, answer in preds.items():
         if not isinstance(answer, str):
-            errors.append(f"{eid}: answer must be string")
-        elif len(answer) != 1 or answer.upper() not in "ABCDE":
-            errors.append(f"{eid}: answer must be single letter A-E")
+            error = f"{eid}: answer must be string"
+        elif len(answer) != 1 or answer.upper() not in _VALID_ANSWERS:
+            error = f"{eid}: answer must be single letter A-E"
+        else:
+            continue
+        invalid += 1
+        if invalid <= _MAX_ERRORS:
+            errors.append(error)
+
+    if invalid > _MAX_ERRORS:
+        errors.append(f"... and {invalid - _MAX_ERRORS} more invalid answers")
 
     return len(errors) == 0, errors
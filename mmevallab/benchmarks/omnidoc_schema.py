@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 class BoundingBox(BaseModel):
@@ -77,6 +77,10 @@ class OmniDocDataset(BaseModel):
         return len(self.annotations)
 
 
+# Validates a whole annotation list in one pass through pydantic-core
+_ANNOTATION_LIST_ADAPTER = TypeAdapter(list[OmniDocAnnotation])
+
+
 def parse_omnidoc_annotation(data: dict[str, Any]) -> OmniDocAnnotation:
     """Parse a single annotation dict into OmniDocAnnotation.
 
@@ -102,7 +106,7 @@ def parse_omnidoc_dataset(data: list[dict[str, Any]], split: str = "test") -> Om
     Returns:
         Validated OmniDocDataset
     """
-    annotations = [parse_omnidoc_annotation(item) for item in data]
+    annotations = _ANNOTATION_LIST_ADAPTER.validate_python(data)
     return OmniDocDataset(split=split, annotations=annotations)
 
 
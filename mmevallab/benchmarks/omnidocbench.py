@@ -3,23 +3,46 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import re
+import sys
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from mmevallab.core import jsonio
 from mmevallab.core.datamodel import Example, MediaRef, Prediction
 from mmevallab.core.registry import Benchmark, register_benchmark
 
 # Task variants supported by OmniDocBench
 OMNIDOCBENCH_TASKS = ["e2e_markdown", "ocr_text", "formula", "table", "layout"]
 
+# LaTeX normalization patterns
+_RE_DOLLAR = re.compile(r"^\$+|\$+$")
+_RE_BRACKET = re.compile(r"^\\\[|\\\]$")
+_RE_WS = re.compile(r"\s+")
+
+# Fallbacks for optional annotation fields; doc_id and pdf_name depend on the row
+_ANNOTATION_DEFAULTS: dict[str, Any] = {
+    "page_num": 1,
+    "doc_type": "unknown",
+    "layout_type": "unknown",
+    "language": "en",
+    "has_formula": False,
+    "has_table": False,
+    "target": None,
+    "ground_truth": None,
+    "bbox": None,
+}
+
 
 def _compute_file_hash(path: Path) -> str:
     """Compute SHA256 hash of file content."""
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        if sys.version_info >= (3, 11):
+            # Read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
     return h.hexdigest()[:16]
 
@@ -68,16 +91,16 @@ class OmniDocBenchmark(Benchmark):
         if not annot_path.exists():
             raise FileNotFoundError(f"Annotations not found: {annot_path}")
 
-        with open(annot_path) as f:
-            annotations = json.load(f)
+        annotations = jsonio.loads(annot_path.read_bytes())
 
         limit = kwargs.get("limit")
         for i, item in enumerate(annotations):
             if limit and i >= limit:
                 break
 
+            item = _ANNOTATION_DEFAULTS | item
             doc_id = item.get("doc_id", f"doc_{i}")
-            page_num = item.get("page_num", 1)
+            page_num = item["page_num"]
             pdf_name = item.get("pdf_name", f"{doc_id}.pdf")
 
             pdf_path = data_dir / "pdfs" / pdf_name
@@ -101,24 +124,24 @@ class OmniDocBenchmark(Benchmark):
 
             # Add task-specific inputs
             if self._task == "formula":
-                inputs["formula_bbox"] = item.get("bbox")
+                inputs["formula_bbox"] = item["bbox"]
             elif self._task == "table":
-                inputs["table_bbox"] = item.get("bbox")
+                inputs["table_bbox"] = item["bbox"]
 
             # Metadata for slicing
             metadata = {
                 "doc_id": doc_id,
-                "doc_type": item.get("doc_type", "unknown"),
-                "layout_type": item.get("layout_type", "unknown"),
-                "language": item.get("language", "en"),
-                "has_formula": item.get("has_formula", False),
-                "has_table": item.get("has_table", False),
+                "doc_type": item["doc_type"],
+                "layout_type": item["layout_type"],
+                "language": item["language"],
+                "has_formula": item["has_formula"],
+                "has_table": item["has_table"],
                 "split": split,
                 "task": self._task,
             }
 
             # Ground truth
-            ground_truth = item.get("target") or item.get("ground_truth")
+            ground_truth = item["target"] or item["ground_truth"]
 
             yield Example(
                 example_id=example_id,
@@ -167,33 +190,51 @@ class OmniDocBenchmark(Benchmark):
 
 def _normalize_latex(text: str) -> str:
     """Normalize LaTeX for comparison."""
-    import re
-
     text = text.strip()
     # Remove common LaTeX wrappers
-    text = re.sub(r"^\$+|\$+$", "", text)
-    text = re.sub(r"^\\\[|\\\]$", "", text)
+    text = _RE_DOLLAR.sub("", text)
+    text = _RE_BRACKET.sub("", text)
     # Normalize whitespace
-    text = re.sub(r"\s+", " ", text)
-    return text
+    return _RE_WS.sub(" ", text)
+
 
+def _edit_distance(s1: str, s2: str, max_edit: int | None = None) -> int:
+    """Compute Levenshtein edit distance.
 
-def _edit_distance(s1: str, s2: str) -> int:
-    """Compute Levenshtein edit distance."""
+    Uses two reusable rows sized by the shorter string. With ``max_edit``,
+    only the diagonal band of that width is filled and the scan stops once
+    every cell in a row exceeds it; ``max_edit + 1`` is returned in that case.
+    """
     if len(s1) < len(s2):
-        return _edit_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    prev_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        curr_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = prev_row[j + 1] + 1
-            deletions = curr_row[j] + 1
-            substitutions = prev_row[j] + (c1 != c2)
-            curr_row.append(min(insertions, deletions, substitutions))
-        prev_row = curr_row
-
-    return prev_row[-1]
+        s1, s2 = s2, s1
+    n, m = len(s1), len(s2)
+    bound = n if max_edit is None else max_edit
+    over = bound + 1
+    if n - m > bound:
+        return over
+    if m == 0:
+        return n
+
+    prev = list(range(m + 1))
+    curr = [0] * (m + 1)
+    for i, c1 in enumerate(s1, 1):
+        lo = max(1, i - bound)
+        hi = min(m, i + bound)
+        left = curr[lo - 1] = i if lo == 1 else over
+        row_min = left
+        for j in range(lo, hi + 1):
+            cell = prev[j - 1] + (c1 != s2[j - 1])
+            if prev[j] + 1 < cell:
+                cell = prev[j] + 1
+            if left + 1 < cell:
+                cell = left + 1
+            curr[j] = left = cell
+            if cell < row_min:
+                row_min = cell
+        if hi < m:
+            curr[hi + 1] = over
+        if row_min > bound:
+            return over
+        prev, curr = curr, prev
+
+    return min(prev[m], over)
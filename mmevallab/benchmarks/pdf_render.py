@@ -2,21 +2,53 @@
 
 from __future__ import annotations
 
-import hashlib
+import functools
+import mmap
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from mmevallab.benchmarks.image_cache import (
+    CACHE_FORMATS,
+    cache_path,
+    check_cache_format,
+    load_image,
+    save_image,
+)
+from mmevallab.core.hashing import content_digest
 
 if TYPE_CHECKING:
+    import numpy as np
     from PIL import Image
 
+# Files at least this large are hashed through mmap instead of read()
+_MMAP_THRESHOLD = 1 << 20
+
+# Open documents a renderer keeps around for repeated page renders
+_MAX_OPEN_DOCS = 8
+
+
+@functools.lru_cache(maxsize=1024)
+def _pdf_hash_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a PDF file; mtime_ns and size only key the memo."""
+    with open(path, "rb") as f:
+        if size < _MMAP_THRESHOLD:
+            return content_digest(f.read())[:16]
+        # Hash the mapped file in a single update() call
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return content_digest(mm)[:16]
+
 
 def _compute_pdf_hash(pdf_path: Path) -> str:
-    """Compute hash of PDF file for cache key."""
-    h = hashlib.sha256()
-    with open(pdf_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()[:16]
+    """Compute hash of PDF file for cache key.
+
+    Memoized on (absolute path, mtime, size), so rendering many pages of
+    one PDF hashes it once.
+    """
+    st = os.stat(pdf_path)
+    return _pdf_hash_cached(os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
 
 
 def _get_cache_key(pdf_path: Path, page_num: int, dpi: int) -> str:
@@ -25,22 +57,85 @@ def _get_cache_key(pdf_path: Path, page_num: int, dpi: int) -> str:
     return f"{pdf_hash}_p{page_num}_dpi{dpi}"
 
 
+def _pixmap_array(pix: Any) -> np.ndarray:
+    """View an RGB pixmap's samples as an (H, W, 3) array without copying."""
+    import numpy as np
+
+    rows = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)
+    return rows[:, : pix.width * 3].reshape(pix.height, pix.width, 3)
+
+
 class PDFRenderer:
     """Cacheable PDF page renderer using PyMuPDF."""
 
-    def __init__(self, cache_dir: Path | str | None = None, dpi: int = 144) -> None:
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        dpi: int = 144,
+        cache_format: str = "png",
+    ) -> None:
         """Initialize renderer.
 
         Args:
             cache_dir: Directory for caching rendered images (None = no caching)
             dpi: Resolution for rendering (default 144)
+            cache_format: Cached image encoding: png (lossless, default for text
+                pages), jpeg, or npy
         """
         self._cache_dir = Path(cache_dir) if cache_dir else None
         self._dpi = dpi
+        self._cache_format = check_cache_format(cache_format)
+
+        # MuPDF documents are not thread-safe; the lock guards docs and renders
+        self._docs: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+        self._matrices: dict[int, Any] = {}
+        self._lock = threading.Lock()
 
         if self._cache_dir:
             self._cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def __enter__(self) -> PDFRenderer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close any documents held open for reuse."""
+        with self._lock:
+            for doc in self._docs.values():
+                doc.close()
+            self._docs.clear()
+
+    def _get_doc(self, fitz: Any, pdf_path: Path) -> Any:
+        """Return an open document for pdf_path, reusing it across pages.
+
+        Keyed by (absolute path, mtime, size) so a rewritten file is reopened.
+        Least recently used documents are closed past _MAX_OPEN_DOCS. Callers
+        must hold self._lock.
+        """
+        st = os.stat(pdf_path)
+        key = (os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
+        doc = self._docs.get(key)
+        if doc is not None:
+            self._docs.move_to_end(key)
+            return doc
+
+        for stale in [k for k in self._docs if k[0] == key[0]]:
+            self._docs.pop(stale).close()
+        doc = self._docs[key] = fitz.open(pdf_path)
+        while len(self._docs) > _MAX_OPEN_DOCS:
+            self._docs.popitem(last=False)[1].close()
+        return doc
+
+    def _get_matrix(self, fitz: Any, dpi: int) -> Any:
+        """Return the shared zoom matrix for a DPI."""
+        mat = self._matrices.get(dpi)
+        if mat is None:
+            zoom = dpi / 72.0  # PDF default is 72 DPI
+            mat = self._matrices[dpi] = fitz.Matrix(zoom, zoom)
+        return mat
+
     def render_page(
         self,
         pdf_path: Path | str,
@@ -69,27 +164,28 @@ class PDFRenderer:
         # Check cache
         if self._cache_dir:
             cache_key = _get_cache_key(pdf_path, page_num, dpi)
-            cache_path = self._cache_dir / f"{cache_key}.png"
-            if cache_path.exists():
-                return Image.open(cache_path)
+            cached = cache_path(self._cache_dir / cache_key, self._cache_format)
+            if cached.exists():
+                return load_image(cached, self._cache_format)
 
-        # Render page
-        doc = fitz.open(pdf_path)
-        try:
+        # Render page from a document kept open across calls
+        with self._lock:
+            doc = self._get_doc(fitz, pdf_path)
             # PyMuPDF uses 0-indexed pages
             page = doc[page_num - 1]
-            zoom = dpi / 72.0  # PDF default is 72 DPI
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
+            pix = page.get_pixmap(matrix=self._get_matrix(fitz, dpi))
 
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        finally:
-            doc.close()
+            # Decode straight from the pixmap's memoryview (no intermediate bytes copy)
+            img = Image.frombuffer(
+                "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1
+            )
 
-        # Cache result
+        # Cache result; npy entries are written straight from the pixmap samples
         if self._cache_dir:
-            img.save(cache_path, "PNG")
+            if self._cache_format == "npy":
+                save_image(_pixmap_array(pix), cached, self._cache_format)
+            else:
+                save_image(img, cached, self._cache_format)
 
         return img
 
@@ -127,23 +223,31 @@ class PDFRenderer:
         if not self._cache_dir:
             return 0
 
+        # Video frame manifests go too: in a shared cache dir they would
+        # otherwise point at deleted frames
+        suffixes = (*CACHE_FORMATS.values(), "_manifest.json")
         count = 0
-        for f in self._cache_dir.glob("*.png"):
-            f.unlink()
-            count += 1
+        with os.scandir(self._cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
+                    count += 1
         return count
 
 
-# Default renderer instance
-_default_renderer: PDFRenderer | None = None
+# Shared renderers keyed by (cache_dir, dpi)
+_renderers: dict[tuple[str | None, int], PDFRenderer] = {}
+_renderers_lock = threading.Lock()
 
 
 def get_renderer(cache_dir: Path | str | None = None, dpi: int = 144) -> PDFRenderer:
-    """Get or create default PDF renderer."""
-    global _default_renderer
-    if _default_renderer is None:
-        _default_renderer = PDFRenderer(cache_dir=cache_dir, dpi=dpi)
-    return _default_renderer
+    """Get or create the shared PDF renderer for a cache directory and DPI."""
+    key = (str(Path(cache_dir)) if cache_dir else None, dpi)
+    with _renderers_lock:
+        renderer = _renderers.get(key)
+        if renderer is None:
+            renderer = _renderers[key] = PDFRenderer(cache_dir=cache_dir, dpi=dpi)
+        return renderer
 
 
 def render_pdf_page(
@@ -154,6 +258,9 @@ def render_pdf_page(
 ) -> "Image.Image":
     """Convenience function to render a PDF page.
 
+    Uses the shared renderer for (cache_dir, dpi), so repeated calls reuse
+    its open documents.
+
     Args:
         pdf_path: Path to PDF file
         page_num: Page number (1-indexed)
@@ -163,5 +270,4 @@ def render_pdf_page(
     Returns:
         PIL Image
     """
-    renderer = PDFRenderer(cache_dir=cache_dir, dpi=dpi)
-    return renderer.render_page(pdf_path, page_num, dpi)
+    return get_renderer(cache_dir, dpi).render_page(pdf_path, page_num)
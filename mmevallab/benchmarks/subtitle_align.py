@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class SubtitleSegment:
     """A subtitle segment with timing."""
 
@@ -14,7 +19,7 @@ class SubtitleSegment:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AlignedSubtitle:
     """Subtitle aligned to a specific frame."""
 
@@ -32,13 +37,17 @@ def parse_subtitles(subtitles: list[dict]) -> list[SubtitleSegment]:
     Returns:
         List of SubtitleSegment objects
     """
-    segments = []
+    segments: list[SubtitleSegment] = []
+    append = segments.append
     for sub in subtitles:
-        # Handle various timestamp formats
-        start = sub.get("start_ms") or sub.get("start", 0) * 1000
-        end = sub.get("end_ms") or sub.get("end", 0) * 1000
-        text = sub.get("text", "")
-        segments.append(SubtitleSegment(start_ms=float(start), end_ms=float(end), text=text))
+        # Handle various timestamp formats; an explicit 0 ms is a valid time
+        start = sub.get("start_ms")
+        if start is None:
+            start = sub.get("start", 0) * 1000
+        end = sub.get("end_ms")
+        if end is None:
+            end = sub.get("end", 0) * 1000
+        append(SubtitleSegment(float(start), float(end), sub.get("text", "")))
     return segments
 
 
@@ -60,35 +69,45 @@ def align_subtitles_to_frames(
     Returns:
         List of AlignedSubtitle objects, one per frame with relevant text
     """
-    aligned = []
-
-    for frame_idx, frame_ts in enumerate(frame_timestamps_ms):
-        # Find subtitles active around this frame
-        # Include subtitles that:
-        # 1. Are currently showing (start <= frame_ts <= end)
-        # 2. Recently ended (within window_ms before frame)
-        relevant_texts = []
-
-        for sub in subtitles:
-            # Subtitle is active at frame time
-            if sub.start_ms <= frame_ts <= sub.end_ms:
-                relevant_texts.append(sub.text)
-            # Subtitle recently ended (within window)
-            elif sub.end_ms <= frame_ts <= sub.end_ms + window_ms:
-                relevant_texts.append(sub.text)
-
-        # Combine relevant subtitles
-        combined_text = " ".join(relevant_texts).strip()
-
-        aligned.append(
-            AlignedSubtitle(
-                frame_idx=frame_idx,
-                timestamp_ms=frame_ts,
-                text=combined_text,
-            )
-        )
-
-    return aligned
+    # Include subtitles that:
+    # 1. Are currently showing (start <= frame_ts <= end)
+    # 2. Recently ended (end <= frame_ts <= end + window_ms)
+    # For window_ms >= 0 the union is min(start, end) <= frame_ts <= end + window_ms.
+    n = len(subtitles)
+    starts = np.fromiter((sub.start_ms for sub in subtitles), dtype=np.float64, count=n)
+    ends = np.fromiter((sub.end_ms for sub in subtitles), dtype=np.float64, count=n)
+    texts = [sub.text for sub in subtitles]
+    lo = np.minimum(starts, ends) if window_ms >= 0 else starts
+    hi = ends + max(window_ms, 0.0)
+
+    # Sweep frames in time order over subtitles sorted by lower bound: a
+    # subtitle enters the active heap once lo <= ts and leaves for good once
+    # hi < ts, so each one is pushed and popped at most once.
+    by_lo = np.argsort(lo, kind="stable").tolist()
+    lo_list = lo.tolist()
+    hi_list = hi.tolist()
+    frame_ts = np.asarray(frame_timestamps_ms, dtype=np.float64)
+    frame_list = frame_ts.tolist()
+
+    combined = [""] * len(frame_timestamps_ms)
+    active: list[tuple[float, int]] = []
+    head = 0
+    for frame_idx in np.argsort(frame_ts, kind="stable").tolist():
+        ts = frame_list[frame_idx]
+        while head < n and lo_list[by_lo[head]] <= ts:
+            j = by_lo[head]
+            heapq.heappush(active, (hi_list[j], j))
+            head += 1
+        while active and active[0][0] < ts:
+            heapq.heappop(active)
+        if active:
+            # Joined in original subtitle order
+            combined[frame_idx] = " ".join([texts[j] for j in sorted(j for _, j in active)]).strip()
+
+    return [
+        AlignedSubtitle(frame_idx=frame_idx, timestamp_ms=ts, text=text)
+        for frame_idx, (ts, text) in enumerate(zip(frame_timestamps_ms, combined))
+    ]
 
 
 def format_subtitles_for_prompt(
@@ -107,16 +126,10 @@ def format_subtitles_for_prompt(
     if not aligned_subtitles:
         return ""
 
-    # Deduplicate consecutive identical subtitles
-    unique_texts = []
-    prev_text = None
-    for sub in aligned_subtitles:
-        if sub.text and sub.text != prev_text:
-            if include_timestamps:
-                ts_sec = sub.timestamp_ms / 1000
-                unique_texts.append(f"[{ts_sec:.1f}s] {sub.text}")
-            else:
-                unique_texts.append(sub.text)
-            prev_text = sub.text
-
-    return "\n".join(unique_texts)
+    # Deduplicate consecutive identical subtitles, ignoring empty ones in
+    # between, and keep the first of each run
+    non_empty = (sub for sub in aligned_subtitles if sub.text)
+    firsts = [next(run) for _, run in groupby(non_empty, key=attrgetter("text"))]
+    if include_timestamps:
+        return "\n".join(f"[{sub.timestamp_ms / 1000:.1f}s] {sub.text}" for sub in firsts)
+    return "\n".join(sub.text for sub in firsts)
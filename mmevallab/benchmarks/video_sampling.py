@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from mmevallab.benchmarks.image_cache import (
+    cache_path,
+    check_cache_format,
+    load_image,
+    save_image,
+)
+from mmevallab.core import jsonio
+from mmevallab.core.hashing import content_digest
 
 if TYPE_CHECKING:
     from PIL import Image
 
+# Bytes hashed from each end of a video for its cache key
+_HASH_SPAN = 1 << 20
+
+# Seek instead of decoding through when the next target frame is further ahead
+_SEEK_MIN_GAP = 48
 
-@dataclass
+
+@dataclass(slots=True)
 class FrameManifest:
     """Manifest of sampled frames with timestamps."""
 
@@ -25,35 +44,139 @@ class FrameManifest:
     cache_dir: str | None = None
 
 
+@functools.lru_cache(maxsize=1024)
+def _video_hash_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Hash the first and last 1MB of a video file.
+
+    This is a cache key, not a content fingerprint: bytes outside the two
+    spans are not covered. mtime_ns only keys the memo.
+    """
+    span = min(_HASH_SPAN, size)
+    with open(path, "rb") as f:
+        head = f.read(span)
+        # The spans overlap for files under 2MB, as they always have
+        f.seek(size - span)
+        return content_digest(head, f.read(span))[:16]
+
+
 def _compute_video_hash(video_path: Path) -> str:
-    """Compute hash of video file for cache key."""
-    h = hashlib.sha256()
-    with open(video_path, "rb") as f:
-        # Read first and last 1MB for speed
-        h.update(f.read(1024 * 1024))
-        f.seek(-min(1024 * 1024, f.seek(0, 2)), 2)
-        h.update(f.read())
-    return h.hexdigest()[:16]
-
-
-def _get_cache_key(video_path: Path, strategy: str, params: dict) -> str:
-    """Generate cache key for sampled frames."""
-    video_hash = _compute_video_hash(video_path)
+    """Compute hash of video file for cache key.
+
+    Memoized on (absolute path, mtime, size).
+    """
+    st = os.stat(video_path)
+    return _video_hash_cached(os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+
+
+def _get_cache_key(video_hash: str, strategy: str, params: dict) -> str:
+    """Generate cache key for sampled frames.
+
+    Kept on stdlib json: its separators are part of existing cache keys.
+    """
     params_str = json.dumps(params, sort_keys=True)
     params_hash = hashlib.sha256(params_str.encode()).hexdigest()[:8]
     return f"{video_hash}_{strategy}_{params_hash}"
 
 
+def _strided_targets(step: float, count: int) -> Iterator[int]:
+    """Yield int(i * step) for i in range(count), skipping repeats.
+
+    Generated lazily so long videos never materialize an index list.
+    """
+    last = -1
+    for i in range(count):
+        index = int(i * step)
+        if index != last:
+            yield index
+            last = index
+
+
+def _decode_frames(
+    container: Any, stream: Any, targets: Iterable[int]
+) -> tuple[list["Image.Image"], list[float]]:
+    """Decode the frames at increasing, unique frame indices.
+
+    ``targets`` is consumed as frames are decoded. When the next target
+    is more than _SEEK_MIN_GAP frames ahead, the container first seeks to the
+    preceding keyframe so the GOPs in between are never decoded. Frame
+    positions come from pts, assuming a constant frame rate.
+    """
+    import av
+
+    frames: list[Image.Image] = []
+    timestamps_ms: list[float] = []
+    time_base = stream.time_base
+    fps = float(stream.average_rate or 0)
+    start = stream.start_time or 0
+    can_seek = fps > 0
+
+    decoder = container.decode(stream)
+    position = -1
+    pending = iter(targets)
+    target = next(pending, None)
+    while target is not None:
+        if can_seek and target - position > _SEEK_MIN_GAP:
+            try:
+                container.seek(
+                    start + int(target / fps / time_base),
+                    stream=stream,
+                    backward=True,
+                    any_frame=False,
+                )
+                decoder = container.decode(stream)
+            except av.error.FFmpegError:
+                # Not seekable: keep decoding sequentially
+                can_seek = False
+
+        for frame in decoder:
+            if frame.pts is not None and fps > 0:
+                position = round(float((frame.pts - start) * time_base) * fps)
+            else:
+                position += 1
+            if position >= target:
+                frames.append(frame.to_image())
+                timestamps_ms.append(float(frame.pts * time_base) * 1000)
+                # Skip any targets this frame already covers
+                while target is not None and target <= position:
+                    target = next(pending, None)
+                break
+        else:
+            # Stream exhausted
+            break
+
+    return frames, timestamps_ms
+
+
+def _manifest_format(data: dict[str, Any]) -> str:
+    """Frame format of a cache manifest; entries predating the field are PNG."""
+    return str(data.get("cache_format", "png"))
+
+
+def _cached_format(manifest_path: Path) -> str:
+    """Frame format of the cache entry whose manifest is at manifest_path."""
+    return _manifest_format(jsonio.loads(manifest_path.read_bytes()))
+
+
+def _io_workers(n_frames: int) -> int:
+    """Thread count for encoding or decoding n_frames cached images."""
+    return max(1, min(n_frames, os.cpu_count() or 1))
+
+
 class VideoFrameSampler:
     """Cacheable video frame sampler."""
 
-    def __init__(self, cache_dir: Path | str | None = None) -> None:
+    def __init__(self, cache_dir: Path | str | None = None, cache_format: str = "png") -> None:
         """Initialize sampler.
 
         Args:
             cache_dir: Directory for caching extracted frames (None = no caching)
+            cache_format: Cached frame encoding: png (lossless, default), npy
+                (lossless, raw pixels), or jpeg. jpeg is lossy: frames served
+                from a warm cache differ from freshly decoded ones, so model
+                inputs depend on cache state.
         """
         self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache_format = check_cache_format(cache_format)
         if self._cache_dir:
             self._cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -111,59 +234,50 @@ class VideoFrameSampler:
             raise ImportError("Install av and pillow: pip install av pillow") from e
 
         video_path = Path(video_path)
-        cache_key = _get_cache_key(video_path, strategy, params)
+        video_hash = _compute_video_hash(video_path)
+        cache_key = _get_cache_key(video_hash, strategy, params)
 
-        # Check cache
+        # Check cache; entries in another format are re-decoded, so a lossy
+        # entry never stands in for lossless frames
         if self._cache_dir:
             manifest_path = self._cache_dir / f"{cache_key}_manifest.json"
-            if manifest_path.exists():
+            if manifest_path.exists() and _cached_format(manifest_path) == self._cache_format:
                 return self._load_cached(cache_key)
 
         # Open video
         container = av.open(str(video_path))
         stream = container.streams.video[0]
+        # Let FFmpeg decode on all cores (frame + slice threading)
+        stream.codec_context.thread_type = "AUTO"
+        stream.codec_context.thread_count = 0
 
         # Get video info
         duration_s = float(stream.duration * stream.time_base)
         fps = float(stream.average_rate)
         total_frames = stream.frames or int(duration_s * fps)
 
-        # Calculate frame indices based on strategy
+        # Frame indices are evenly spaced, so stream them from a stride
         if strategy == "uniform":
             num_frames = params["num_frames"]
             if total_frames <= num_frames:
-                indices = list(range(total_frames))
+                targets = _strided_targets(1.0, total_frames)
             else:
-                step = total_frames / num_frames
-                indices = [int(i * step) for i in range(num_frames)]
+                targets = _strided_targets(total_frames / num_frames, num_frames)
         elif strategy == "fps":
-            target_fps = params["target_fps"]
-            step = fps / target_fps
-            indices = [int(i * step) for i in range(int(total_frames / step))]
+            step = fps / params["target_fps"]
+            targets = _strided_targets(step, int(total_frames / step))
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
 
         # Extract frames
-        frames = []
-        timestamps_ms = []
-        frame_idx = 0
-        target_set = set(indices)
-
-        for frame in container.decode(video=0):
-            if frame_idx in target_set:
-                img = frame.to_image()
-                frames.append(img)
-                timestamps_ms.append(float(frame.pts * stream.time_base) * 1000)
-            frame_idx += 1
-            if len(frames) >= len(indices):
-                break
+        frames, timestamps_ms = _decode_frames(container, stream, targets)
 
         container.close()
 
         # Create manifest
         manifest = FrameManifest(
             video_path=str(video_path),
-            video_hash=_compute_video_hash(video_path),
+            video_hash=video_hash,
             strategy=strategy,
             params=params,
             frame_count=len(frames),
@@ -187,10 +301,21 @@ class VideoFrameSampler:
         if not self._cache_dir:
             return
 
-        # Save manifest
+        # Save frames; encoding releases the GIL, so spread it over threads
+        cache_dir = self._cache_dir
+        cache_format = self._cache_format
+
+        def save_frame(i: int, frame: Image.Image) -> None:
+            stem = cache_dir / f"{cache_key}_frame_{i:04d}"
+            save_image(frame, cache_path(stem, cache_format), cache_format)
+
+        with ThreadPoolExecutor(max_workers=_io_workers(len(frames))) as pool:
+            list(pool.map(save_frame, range(len(frames)), frames))
+
+        # Save manifest last: its presence marks the cache entry as complete
         manifest_path = self._cache_dir / f"{cache_key}_manifest.json"
-        with open(manifest_path, "w") as f:
-            json.dump(
+        with open(manifest_path, "wb") as f:
+            jsonio.dump(
                 {
                     "video_path": manifest.video_path,
                     "video_hash": manifest.video_hash,
@@ -198,29 +323,22 @@ class VideoFrameSampler:
                     "params": manifest.params,
                     "frame_count": manifest.frame_count,
                     "timestamps_ms": manifest.timestamps_ms,
+                    "cache_format": cache_format,
                 },
                 f,
             )
 
-        # Save frames
-        for i, frame in enumerate(frames):
-            frame_path = self._cache_dir / f"{cache_key}_frame_{i:04d}.png"
-            frame.save(frame_path, "PNG")
-
     def _load_cached(
         self,
         cache_key: str,
     ) -> tuple[list["Image.Image"], FrameManifest]:
         """Load frames and manifest from cache."""
-        from PIL import Image
-
         if not self._cache_dir:
             raise ValueError("No cache directory configured")
 
         # Load manifest
         manifest_path = self._cache_dir / f"{cache_key}_manifest.json"
-        with open(manifest_path) as f:
-            data = json.load(f)
+        data = jsonio.loads(manifest_path.read_bytes())
 
         manifest = FrameManifest(
             video_path=data["video_path"],
@@ -232,10 +350,15 @@ class VideoFrameSampler:
             cache_dir=str(self._cache_dir),
         )
 
-        # Load frames
-        frames = []
-        for i in range(manifest.frame_count):
-            frame_path = self._cache_dir / f"{cache_key}_frame_{i:04d}.png"
-            frames.append(Image.open(frame_path))
+        # Load and decode frames in parallel
+        cache_dir = self._cache_dir
+        cache_format = _manifest_format(data)
+
+        def load_frame(i: int) -> Image.Image:
+            stem = cache_dir / f"{cache_key}_frame_{i:04d}"
+            return load_image(cache_path(stem, cache_format), cache_format)
+
+        with ThreadPoolExecutor(max_workers=_io_workers(manifest.frame_count)) as pool:
+            frames = list(pool.map(load_frame, range(manifest.frame_count)))
 
         return frames, manifest
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Iterator
+import os
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+from mmevallab.core import jsonio
 from mmevallab.core.datamodel import Example, MediaRef, Prediction
 from mmevallab.core.registry import Benchmark, register_benchmark
 
@@ -31,6 +33,17 @@ class LicenseNotAcceptedError(Exception):
     pass
 
 
+def _list_dir(path: Path) -> set[str] | None:
+    """Entry names in a directory, or None if it cannot be listed."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+    except OSError:
+        return None
+
+
 @register_benchmark("videomme")
 class VideoMMEBenchmark(Benchmark):
     """Video-MME: Video understanding benchmark with MCQ questions."""
@@ -89,26 +102,34 @@ class VideoMMEBenchmark(Benchmark):
         if not annot_path.exists():
             raise FileNotFoundError(f"Annotations not found: {annot_path}")
 
-        with open(annot_path) as f:
-            annotations = json.load(f)
-
+        # With a limit, decode only the first records instead of the whole file
         limit = kwargs.get("limit")
-        for i, item in enumerate(annotations):
-            if limit and i >= limit:
-                break
+        annotations: Iterable[dict[str, Any]]
+        if limit:
+            annotations = islice(jsonio.iter_array(annot_path.read_text()), limit)
+        else:
+            annotations = jsonio.loads(annot_path.read_bytes())
+
+        videos_dir = data_dir / "videos"
+        available = _list_dir(videos_dir)
 
+        for i, item in enumerate(annotations):
             video_id = item.get("video_id", f"video_{i}")
             question_id = item.get("question_id", 0)
             video_name = item.get("video_name", f"{video_id}.mp4")
 
-            video_path = data_dir / "videos" / video_name
+            video_path = videos_dir / video_name
             example_id = f"{video_id}_q{question_id}"
 
-            # Create media reference for video
+            # Create media reference for video; nested names still need a stat
+            if available is not None and os.sep not in video_name and "/" not in video_name:
+                exists = video_name in available
+            else:
+                exists = video_path.exists()
             media = [
                 MediaRef(
                     type="video",
-                    path=video_path if video_path.exists() else None,
+                    path=video_path if exists else None,
                 )
             ]
 
@@ -0,0 +1,46 @@
+"""MMEvalLab CLI entry point.
+
+Module-level imports stay limited to click and the standard library so
+``mmeval --help`` starts fast. Each subcommand lives in its own
+``_cmd_<name>`` module, imported only when the command is looked up.
+"""
+
+import importlib
+from typing import Any
+
+import click
+
+# Command name -> module defining it as ``cmd``
+_COMMANDS = {
+    "run": "mmevallab.cli._cmd_run",
+    "compare": "mmevallab.cli._cmd_compare",
+    "contam": "mmevallab.cli._cmd_contam",
+    "slices": "mmevallab.cli._cmd_slices",
+    "attrib": "mmevallab.cli._cmd_attrib",
+    "export": "mmevallab.cli._cmd_export",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands are imported on first lookup."""
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        module = self.lazy_subcommands.get(cmd_name)
+        if module is None:
+            return super().get_command(ctx, cmd_name)
+        command: click.Command = importlib.import_module(module).cmd
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_COMMANDS)
+@click.version_option()
+def main() -> None:
+    """MMEvalLab: Unified multimodal regression harness."""
+    pass
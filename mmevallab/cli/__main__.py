@@ -0,0 +1,5 @@
+"""Allow ``python -m mmevallab.cli``."""
+
+from mmevallab.cli import main
+
+main()
@@ -0,0 +1,16 @@
+"""mmeval attrib: attribute slice changes to data differences."""
+
+from typing import Optional
+
+import click
+
+
+@click.command("attrib")
+@click.argument("run1", type=click.Path(exists=True))
+@click.argument("run2", type=click.Path(exists=True))
+@click.option("--diff", "-d", type=click.Path(exists=True), help="Dataset diff manifest")
+@click.option("--output", "-o", type=click.Path(), help="Output path for attribution")
+def cmd(run1: str, run2: str, diff: Optional[str], output: Optional[str]) -> None:
+    """Attribute slice changes to data differences."""
+    click.echo(f"mmeval attrib: {run1} vs {run2}")
+    click.echo("Not yet implemented")
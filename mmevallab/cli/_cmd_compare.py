@@ -0,0 +1,36 @@
+"""mmeval compare: compare two evaluation runs."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+@click.command("compare")
+@click.argument("run1", type=click.Path(exists=True))
+@click.argument("run2", type=click.Path(exists=True))
+@click.option("--output", "-o", type=click.Path(), help="Output path for comparison")
+@click.option("--format", "-f", type=click.Choice(["json", "md"]), default="json")
+def cmd(run1: str, run2: str, output: Optional[str], format: str) -> None:
+    """Compare two evaluation runs."""
+    from mmevallab.eval.compare import compare_runs, format_comparison_report
+
+    click.echo(f"Comparing: {run1} vs {run2}")
+
+    comparison = compare_runs(run1, run2, output_path=output if format == "json" else None)
+
+    # Print summary
+    metrics = comparison["metrics"]
+    click.echo(f"Run 1 accuracy: {metrics['run1_accuracy']:.2%}")
+    click.echo(f"Run 2 accuracy: {metrics['run2_accuracy']:.2%}")
+    click.echo(f"Delta: {metrics['delta_pct']}")
+
+    changes = comparison["example_changes"]
+    click.echo(f"Regressions: {changes['correct_to_incorrect']}")
+    click.echo(f"Improvements: {changes['incorrect_to_correct']}")
+    click.echo(f"Net change: {changes['net_change']:+d}")
+
+    if output and format == "md":
+        report = format_comparison_report(comparison)
+        Path(output).write_text(report)
+        click.echo(f"Report written to: {output}")
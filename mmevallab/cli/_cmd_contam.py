@@ -0,0 +1,44 @@
+"""mmeval contam: scan for contamination between training data and benchmark."""
+
+from typing import Optional
+
+import click
+
+
+@click.command("contam")
+@click.option("--benchmark", "-b", type=str, required=True, help="Benchmark to scan")
+@click.option("--manifest", "-m", type=click.Path(exists=True), required=True, help="Manifest")
+@click.option("--output", "-o", type=click.Path(), help="Output report path")
+@click.option("--split", "-s", type=str, default="validation", help="Benchmark split")
+@click.option("--limit", type=int, help="Limit examples")
+@click.option("--index-cache", type=click.Path(), help="Directory to cache the training index")
+def cmd(
+    benchmark: str,
+    manifest: str,
+    output: Optional[str],
+    split: str,
+    limit: Optional[int],
+    index_cache: Optional[str],
+) -> None:
+    """Scan for contamination between training data and benchmark."""
+    from mmevallab.contamination.scanner import run_contamination_scan
+
+    click.echo(f"Scanning {benchmark} ({split}) against {manifest}")
+
+    report = run_contamination_scan(
+        benchmark_name=benchmark,
+        manifest_path=manifest,
+        output_path=output,
+        split=split,
+        limit=limit,
+        index_cache_dir=index_cache,
+    )
+
+    click.echo(f"Total examples: {report['total_examples']}")
+    click.echo(f"Exact matches: {report['exact_matches']}")
+    click.echo(f"Near matches: {report['near_matches']}")
+    click.echo(f"Clean: {report['clean']}")
+    click.echo(f"Contamination rate: {report['contamination_rate']:.2%}")
+
+    if output:
+        click.echo(f"Report written to: {output}")
@@ -0,0 +1,16 @@
+"""mmeval export: export run artifacts (license-safe)."""
+
+import click
+
+
+@click.command("export")
+@click.argument("run_dir", type=click.Path(exists=True))
+@click.option("--output", "-o", type=click.Path(), required=True, help="Output archive path")
+@click.option("--format", "-f", "fmt", type=click.Choice(["tar.gz", "zip"]), default="tar.gz")
+def cmd(run_dir: str, output: str, fmt: str) -> None:
+    """Export run artifacts (license-safe)."""
+    from mmevallab.reporting.export import export_artifact_pack
+
+    click.echo(f"Exporting {run_dir} to {output}")
+    result = export_artifact_pack(run_dir, output, format=fmt)
+    click.echo(f"Created: {result}")
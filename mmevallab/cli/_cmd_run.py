@@ -0,0 +1,43 @@
+"""mmeval run: run evaluation on a benchmark."""
+
+from typing import Optional
+
+import click
+
+
+@click.command("run")
+@click.option("--config", "-c", type=click.Path(exists=True), help="Config file path")
+@click.option("--benchmark", "-b", type=str, help="Benchmark name")
+@click.option("--model", "-m", type=str, help="Model name")
+@click.option("--split", "-s", type=str, default="validation", help="Dataset split")
+@click.option("--output", "-o", type=click.Path(), help="Output directory")
+@click.option("--limit", type=int, help="Limit number of examples")
+def cmd(
+    config: Optional[str],
+    benchmark: Optional[str],
+    model: Optional[str],
+    split: str,
+    output: Optional[str],
+    limit: Optional[int],
+) -> None:
+    """Run evaluation on a benchmark."""
+    from mmevallab.eval.runner import run_evaluation
+
+    if not benchmark or not model:
+        click.echo("Error: --benchmark and --model are required", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"Running evaluation: benchmark={benchmark}, model={model}, split={split}")
+
+    result = run_evaluation(
+        benchmark_name=benchmark,
+        model_name=model,
+        split=split,
+        output_dir=output,
+        limit=limit,
+    )
+
+    click.echo(f"Run ID: {result['run_id']}")
+    click.echo(f"Output: {result['output_dir']}")
+    click.echo(f"Examples: {result['num_examples']}")
+    click.echo(f"Accuracy: {result['metrics']['overall_accuracy']:.2%}")
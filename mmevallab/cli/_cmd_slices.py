@@ -0,0 +1,14 @@
+"""mmeval slices: analyze slices in a run."""
+
+from typing import Optional
+
+import click
+
+
+@click.command("slices")
+@click.argument("run_dir", type=click.Path(exists=True))
+@click.option("--output", "-o", type=click.Path(), help="Output path for slice report")
+def cmd(run_dir: str, output: Optional[str]) -> None:
+    """Analyze slices in a run."""
+    click.echo(f"mmeval slices: {run_dir}")
+    click.echo("Not yet implemented")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
@@ -25,22 +24,67 @@ class TrainingSample(BaseModel):
 
 
 def load_manifest_jsonl(path: Path | str) -> Iterator[TrainingSample]:
-    """Load training manifest from JSONL file."""
-    with open(path) as f:
+    """Load training manifest from JSONL file.
+
+    Each line is parsed and validated in one pass by pydantic's JSON parser.
+    """
+    with open(path, "rb") as f:
         for line in f:
-            data = json.loads(line)
-            yield TrainingSample.model_validate(data)
+            yield TrainingSample.model_validate_json(line)
+
+
+# Parquet columns read into TrainingSample beyond sample_id and modality
+_OPTIONAL_COLUMNS = ("text", "image_ref", "video_ref", "source", "license", "timestamp")
+
+
+def load_manifest_parquet(path: Path | str, engine: str = "pyarrow") -> Iterator[TrainingSample]:
+    """Load training manifest from Parquet file.
+
+    Args:
+        path: Manifest path
+        engine: "pyarrow" (default; the ``parquet`` extra) converts record
+            batches column-wise; "pandas" iterates DataFrame rows
+    """
+    if engine == "pandas":
+        yield from _load_manifest_parquet_pandas(path)
+        return
+    if engine != "pyarrow":
+        raise ValueError(f"Unknown engine: {engine}")
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Install pyarrow: pip install pyarrow") from e
+
+    parquet_file = pq.ParquetFile(path)
+    present = set(parquet_file.schema_arrow.names)
+    columns = [c for c in ("sample_id", "modality", *_OPTIONAL_COLUMNS) if c in present]
+    for batch in parquet_file.iter_batches(columns=columns):
+        data = batch.to_pydict()
+        n = batch.num_rows
+        optional = [data.get(c, [None] * n) for c in _OPTIONAL_COLUMNS]
+        for sample_id, modality, *values in zip(
+            data.get("sample_id", [""] * n), data.get("modality", ["text"] * n), *optional
+        ):
+            yield TrainingSample(
+                sample_id=str(sample_id),
+                modality=str(modality),
+                **dict(zip(_OPTIONAL_COLUMNS, values)),
+            )
 
 
-def load_manifest_parquet(path: Path | str) -> Iterator[TrainingSample]:
-    """Load training manifest from Parquet file."""
+def _load_manifest_parquet_pandas(path: Path | str) -> Iterator[TrainingSample]:
+    """Load a Parquet manifest row by row through pandas."""
     try:
         import pandas as pd
     except ImportError as e:
         raise ImportError("Install pandas: pip install pandas") from e
 
     df = pd.read_parquet(path)
-    for _, row in df.iterrows():
+    # Nulls read back as NaN or pd.NA; TrainingSample expects None. Rows are
+    # taken as dicts, as iterrows would re-infer a dtype and restore NaN.
+    df = df.astype(object).where(df.notna(), None)
+    for row in df.to_dict("records"):
         yield TrainingSample(
             sample_id=str(row.get("sample_id", "")),
             modality=str(row.get("modality", "text")),
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
 from typing import Iterator
 
+import numpy as np
+
+# Fixed seed for the hash permutations, so signatures compare across processes
+_PERMUTATION_SEED = 0
+
+# Shingles hashed per block, bounding the (block, num_hashes) working matrix
+_SHINGLE_BLOCK = 4096
+
 
 def _shingle(text: str, k: int = 5) -> Iterator[str]:
     """Generate k-shingles from text."""
@@ -15,10 +24,21 @@ def _shingle(text: str, k: int = 5) -> Iterator[str]:
         yield " ".join(words[i : i + k])
 
 
-def _hash_shingle(shingle: str, seed: int) -> int:
-    """Hash a shingle with a seed."""
-    data = f"{seed}:{shingle}".encode()
-    return int(hashlib.md5(data).hexdigest(), 16)
+def _hash_shingle(shingle: str) -> int:
+    """Hash a shingle to 64 bits."""
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+
+
+@functools.lru_cache(maxsize=8)
+def _permutations(num_hashes: int) -> tuple[np.ndarray, np.ndarray]:
+    """Multipliers and offsets of num_hashes permutations of 64-bit values.
+
+    ``h -> a * h + b (mod 2**64)`` is a bijection for odd ``a``.
+    """
+    rng = np.random.default_rng(_PERMUTATION_SEED)
+    a = rng.integers(0, 1 << 63, size=num_hashes, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, np.iinfo(np.uint64).max, size=num_hashes, dtype=np.uint64, endpoint=True)
+    return a, b
 
 
 class MinHash:
@@ -26,27 +46,31 @@ class MinHash:
 
     def __init__(self, num_hashes: int = 128) -> None:
         self.num_hashes = num_hashes
-        self.signature: list[int] = []
+        self.signature: np.ndarray = np.zeros(0, dtype=np.uint64)
 
     def compute(self, text: str, shingle_size: int = 5) -> "MinHash":
         """Compute MinHash signature for text."""
         shingles = set(_shingle(text, shingle_size))
         if not shingles:
-            self.signature = [0] * self.num_hashes
+            self.signature = np.zeros(self.num_hashes, dtype=np.uint64)
             return self
 
-        self.signature = []
-        for seed in range(self.num_hashes):
-            min_hash = min(_hash_shingle(s, seed) for s in shingles)
-            self.signature.append(min_hash)
+        # Hash each shingle once, then apply every permutation in NumPy
+        hashes = np.fromiter(map(_hash_shingle, shingles), dtype=np.uint64, count=len(shingles))
+        a, b = _permutations(self.num_hashes)
+        signature = np.full(self.num_hashes, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for start in range(0, len(hashes), _SHINGLE_BLOCK):
+            permuted = hashes[start : start + _SHINGLE_BLOCK, None] * a + b
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        self.signature = signature
         return self
 
     def jaccard(self, other: "MinHash") -> float:
         """Estimate Jaccard similarity with another MinHash."""
         if len(self.signature) != len(other.signature):
             raise ValueError("Signatures must have same length")
-        matches = sum(1 for a, b in zip(self.signature, other.signature) if a == b)
-        return matches / len(self.signature)
+        matches = int(np.count_nonzero(self.signature == other.signature))
+        return matches / self.signature.size
 
 
 class LSHIndex:
@@ -55,31 +79,28 @@ class LSHIndex:
     def __init__(self, num_bands: int = 16, rows_per_band: int = 8) -> None:
         self.num_bands = num_bands
         self.rows_per_band = rows_per_band
-        self._buckets: list[dict[int, list[str]]] = [{} for _ in range(num_bands)]
+        self._buckets: list[dict[bytes, list[str]]] = [{} for _ in range(num_bands)]
         self._signatures: dict[str, MinHash] = {}
 
+    def _band_keys(self, minhash: MinHash) -> list[bytes]:
+        """Bucket key of each band: the raw bytes of its signature slice."""
+        rows = self.rows_per_band
+        sig = minhash.signature
+        return [sig[i * rows : (i + 1) * rows].tobytes() for i in range(self.num_bands)]
+
     def add(self, doc_id: str, minhash: MinHash) -> None:
         """Add document to index."""
         self._signatures[doc_id] = minhash
-        for band_idx in range(self.num_bands):
-            start = band_idx * self.rows_per_band
-            end = start + self.rows_per_band
-            band = tuple(minhash.signature[start:end])
-            bucket_key = hash(band)
-            if bucket_key not in self._buckets[band_idx]:
-                self._buckets[band_idx][bucket_key] = []
-            self._buckets[band_idx][bucket_key].append(doc_id)
+        for buckets, key in zip(self._buckets, self._band_keys(minhash)):
+            buckets.setdefault(key, []).append(doc_id)
 
     def query(self, minhash: MinHash, threshold: float = 0.8) -> list[tuple[str, float]]:
         """Find near-duplicates above threshold."""
         candidates: set[str] = set()
-        for band_idx in range(self.num_bands):
-            start = band_idx * self.rows_per_band
-            end = start + self.rows_per_band
-            band = tuple(minhash.signature[start:end])
-            bucket_key = hash(band)
-            if bucket_key in self._buckets[band_idx]:
-                candidates.update(self._buckets[band_idx][bucket_key])
+        for buckets, key in zip(self._buckets, self._band_keys(minhash)):
+            bucket = buckets.get(key)
+            if bucket is not None:
+                candidates.update(bucket)
 
         results = []
         for doc_id in candidates:
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import hashlib
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from PIL import Image
 
@@ -16,33 +19,95 @@ def compute_pdq_hash(image: "Image.Image", hash_size: int = 16) -> str:
     """
     # Resize to small square
     img = image.convert("L").resize((hash_size, hash_size))
-    pixels = list(img.getdata())
-
-    # Compute mean
-    mean = sum(pixels) / len(pixels)
+    pixels = np.asarray(img, dtype=np.uint8).ravel()
 
-    # Generate hash bits
-    bits = "".join("1" if p > mean else "0" for p in pixels)
+    # Generate hash bits (the uint8 sum, hence the mean, is exact in float64)
+    bits = pixels > pixels.mean()
 
-    # Convert to hex
-    hash_int = int(bits, 2)
+    # Pack MSB-first, left-padding to whole bytes, then convert to hex
+    packed = np.packbits(np.concatenate([np.zeros(-bits.size % 8, dtype=bool), bits]))
+    hash_int = int.from_bytes(packed.tobytes(), "big")
     return f"{hash_int:0{hash_size * hash_size // 4}x}"
 
 
 def hamming_distance(hash1: str, hash2: str) -> int:
-    """Compute Hamming distance between two hashes."""
+    """Compute the bitwise Hamming distance between two hex hashes."""
     if len(hash1) != len(hash2):
         raise ValueError("Hashes must have same length")
-    return sum(c1 != c2 for c1, c2 in zip(hash1, hash2))
+    return (int(hash1, 16) ^ int(hash2, 16)).bit_count()
 
 
 def pdq_similarity(hash1: str, hash2: str) -> float:
     """Compute similarity (0-1) between two PDQ hashes."""
     dist = hamming_distance(hash1, hash2)
-    max_dist = len(hash1)
+    max_dist = len(hash1) * 4
     return 1.0 - (dist / max_dist)
 
 
+@dataclass(slots=True)
+class _BKNode:
+    """BK-tree node: one hash, the ids sharing it, children by distance."""
+
+    hash_int: int
+    ids: list[str]
+    children: dict[int, _BKNode] = field(default_factory=dict)
+
+
+class PDQIndex:
+    """BK-tree over PDQ hashes for Hamming-radius queries.
+
+    The triangle inequality lets a query skip every subtree whose edge
+    distance differs from the query's distance to the parent by more than
+    the radius, instead of scanning all hashes.
+    """
+
+    def __init__(self) -> None:
+        self._root: _BKNode | None = None
+        self._size = 0
+
+    def add(self, item_id: str, pdq_hash: str) -> None:
+        """Index an item by its hex PDQ hash."""
+        hash_int = int(pdq_hash, 16)
+        self._size += 1
+        if self._root is None:
+            self._root = _BKNode(hash_int, [item_id])
+            return
+        node = self._root
+        while True:
+            dist = (node.hash_int ^ hash_int).bit_count()
+            if dist == 0:
+                node.ids.append(item_id)
+                return
+            child = node.children.get(dist)
+            if child is None:
+                node.children[dist] = _BKNode(hash_int, [item_id])
+                return
+            node = child
+
+    def query(self, pdq_hash: str, max_dist: int) -> list[tuple[str, int]]:
+        """Find items within max_dist bits of a hex PDQ hash.
+
+        Returns:
+            (item_id, distance) pairs, nearest first
+        """
+        hash_int = int(pdq_hash, 16)
+        results: list[tuple[str, int]] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            dist = (node.hash_int ^ hash_int).bit_count()
+            if dist <= max_dist:
+                results.extend((item_id, dist) for item_id in node.ids)
+            for edge, child in node.children.items():
+                if abs(edge - dist) <= max_dist:
+                    stack.append(child)
+        results.sort(key=lambda x: x[1])
+        return results
+
+    def __len__(self) -> int:
+        return self._size
+
+
 def hash_pdf_page(pdf_path: str, page_num: int = 0) -> str:
     """Compute perceptual hash for a PDF page."""
     try:
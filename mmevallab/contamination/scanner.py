@@ -2,50 +2,146 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import mmap
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from mmevallab.contamination.fingerprint import TextFingerprintIndex
-from mmevallab.contamination.manifest import load_manifest
+from mmevallab.contamination.fingerprint import (
+    TextFingerprintIndex,
+    compute_fingerprint,
+    normalize_text,
+)
+from mmevallab.contamination.manifest import load_manifest, stream_manifest
+from mmevallab.core.hashing import content_digest, get_code_version
+
+# Manifest samples per worker task when building the index in parallel
+_INDEX_BATCH_SIZE = 4096
+
+# Near matches listed in full in a report; the rest are only counted
+_MAX_NEAR_DETAILS = 100
+
+
+def _fingerprint_batch(
+    samples: list[tuple[str, str]],
+) -> list[tuple[str, str, array[int]]]:
+    """Fingerprint (sample_id, text) pairs; runs in a worker process."""
+    results = []
+    for sample_id, text in samples:
+        exact_hash, ngram_hashes = compute_fingerprint(text)
+        results.append((sample_id, exact_hash, array("q", ngram_hashes)))
+    return results
+
+
+def _manifest_digest(path: Path) -> str:
+    """Content digest of a manifest file."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return content_digest(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return content_digest(mm)
 
 
 def build_training_index(
     manifest_path: Path | str,
     text_field: str = "text",
+    max_workers: int | None = None,
+    cache_dir: Path | str | None = None,
 ) -> TextFingerprintIndex:
-    """Build fingerprint index from training manifest."""
+    """Build fingerprint index from training manifest.
+
+    Args:
+        manifest_path: Training manifest (JSONL or Parquet)
+        text_field: Unused; samples are indexed by their ``text``
+        max_workers: If set, fingerprint manifest batches on a pool of this
+            many processes
+        cache_dir: If set, reuse an index saved there for the same manifest
+            content and code version, or save the built one there
+    """
+    if cache_dir is None:
+        return _build_training_index(manifest_path, max_workers)
+
+    key = f"{_manifest_digest(Path(manifest_path))[:16]}-{get_code_version()}"
+    cached = Path(cache_dir) / f"text_index_{key}"
+    try:
+        return TextFingerprintIndex.load(cached)
+    except (OSError, ValueError):
+        pass
+    index = _build_training_index(manifest_path, max_workers)
+    # Best effort: a read-only cache dir or a concurrent writer only costs
+    # the next scan a rebuild
+    with contextlib.suppress(OSError):
+        index.save(cached)
+    return index
+
+
+def _build_training_index(
+    manifest_path: Path | str, max_workers: int | None
+) -> TextFingerprintIndex:
+    """Fingerprint every sample with text in a manifest."""
     index = TextFingerprintIndex()
-    for sample in load_manifest(manifest_path):
-        text = sample.text or ""
-        if text:
-            index.add(sample.sample_id, text)
+    if max_workers is None:
+        for sample in load_manifest(manifest_path):
+            text = sample.text or ""
+            if text:
+                index.add(sample.sample_id, text)
+        return index
+
+    batches = (
+        [(sample.sample_id, sample.text) for sample in batch if sample.text]
+        for batch in stream_manifest(manifest_path, batch_size=_INDEX_BATCH_SIZE)
+    )
+    # Bound the batches in flight and merge in submission order, so the
+    # index matches a serial build without holding the whole manifest
+    in_flight: deque[Future[list[tuple[str, str, array[int]]]]] = deque()
+    with ProcessPoolExecutor(max_workers) as pool:
+        for batch in batches:
+            in_flight.append(pool.submit(_fingerprint_batch, batch))
+            if len(in_flight) >= 2 * max_workers:
+                for fingerprint in in_flight.popleft().result():
+                    index.add_fingerprint(*fingerprint)
+        while in_flight:
+            for fingerprint in in_flight.popleft().result():
+                index.add_fingerprint(*fingerprint)
     return index
 
 
 def scan_benchmark(
-    benchmark_examples: list[dict[str, Any]],
+    benchmark_examples: Iterable[dict[str, Any]],
     index: TextFingerprintIndex,
     text_field: str = "question",
     threshold: float = 0.5,
 ) -> dict[str, Any]:
     """Scan benchmark examples against training index.
 
+    Examples are consumed one at a time, so a generator is scanned without
+    materializing the split.
+
     Returns:
         Dict with contamination report
     """
     exact_matches = []
-    near_matches = []
-    clean = []
+    near_matches: list[dict[str, Any]] = []
+    total = near_count = clean_count = 0
 
     for example in benchmark_examples:
+        total += 1
         example_id = example.get("example_id", "")
         text = example.get("inputs", {}).get(text_field, "")
         if not text:
             text = example.get(text_field, "")
 
+        # Normalize once for both lookups
+        text = normalize_text(text)
+
         # Check exact
-        exact = index.find_exact(text)
+        exact = index.find_exact(text, normalize=False)
         if exact:
             exact_matches.append({
                 "example_id": example_id,
@@ -55,27 +151,27 @@ def scan_benchmark(
             continue
 
         # Check near
-        near = index.find_near(text, threshold=threshold)
+        near = index.find_near(text, threshold=threshold, normalize=False)
         if near:
-            near_matches.append({
-                "example_id": example_id,
-                "matched_samples": [m[0] for m in near[:5]],
-                "similarity": near[0][1] if near else 0,
-                "match_type": "near",
-            })
+            near_count += 1
+            if len(near_matches) < _MAX_NEAR_DETAILS:
+                near_matches.append({
+                    "example_id": example_id,
+                    "matched_samples": [m[0] for m in near[:5]],
+                    "similarity": near[0][1],
+                    "match_type": "near",
+                })
         else:
-            clean.append(example_id)
+            clean_count += 1
 
     return {
-        "total_examples": len(benchmark_examples),
+        "total_examples": total,
         "exact_matches": len(exact_matches),
-        "near_matches": len(near_matches),
-        "clean": len(clean),
-        "contamination_rate": (len(exact_matches) + len(near_matches)) / len(benchmark_examples)
-        if benchmark_examples
-        else 0,
+        "near_matches": near_count,
+        "clean": clean_count,
+        "contamination_rate": (len(exact_matches) + near_count) / total if total else 0,
         "exact_match_details": exact_matches,
-        "near_match_details": near_matches[:100],  # Limit details
+        "near_match_details": near_matches,
     }
 
 
@@ -85,24 +181,29 @@ def run_contamination_scan(
     output_path: Path | str | None = None,
     split: str = "validation",
     limit: int | None = None,
+    index_cache_dir: Path | str | None = None,
 ) -> dict[str, Any]:
-    """Run full contamination scan."""
+    """Run full contamination scan.
+
+    Pass ``index_cache_dir`` to reuse the training index across scans of
+    the same manifest.
+    """
     import mmevallab.benchmarks  # noqa: F401
     from mmevallab.core import benchmark_registry
 
-    # Load benchmark
+    # Load benchmark lazily; examples stream through the scan
     benchmark = benchmark_registry.create(benchmark_name)
-    examples = [
+    examples = (
         {
             "example_id": ex.example_id,
             "inputs": ex.inputs,
             "metadata": ex.metadata,
         }
         for ex in benchmark.load(split, limit=limit)
-    ]
+    )
 
     # Build index
-    index = build_training_index(manifest_path)
+    index = build_training_index(manifest_path, cache_dir=index_cache_dir)
 
     # Scan
     report = scan_benchmark(examples, index)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,18 @@ class MediaRef(BaseModel):
     url: str | None = None
     page_num: int | None = Field(default=None, description="Page number for PDFs")
     frame_indices: list[int] | None = Field(default=None, description="Frame indices for video")
+    loader: Callable[[], Any] | None = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="Deferred loader for in-memory media (not serialized)",
+    )
+
+    def load(self) -> Any:
+        """Materialize the media content from its deferred loader."""
+        if self.loader is None:
+            raise ValueError(f"No loader for {self.type} media")
+        return self.loader()
 
 
 class Example(BaseModel):
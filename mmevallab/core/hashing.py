@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import os
 import subprocess
 from typing import Any
 
+# Environment variable selecting the content-hash backend for cache keys
+CONTENT_HASH_ENV = "MMEVALLAB_HASH"
+
 
 def _canonicalize(obj: Any) -> str:
-    """Canonicalize object to deterministic JSON string."""
+    """Canonicalize object to deterministic JSON string.
+
+    Deliberately the stdlib encoder rather than orjson: orjson writes
+    non-ASCII text unescaped, exponents as ``1e-7`` rather than ``1e-07``,
+    and datetimes in ISO form, any of which would change existing run ids.
+    """
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
 
 
+@functools.lru_cache(maxsize=1)
 def get_code_version() -> str:
-    """Get current git commit hash, or 'unknown' if not in a git repo."""
+    """Get current git commit hash, or 'unknown' if not in a git repo.
+
+    Probed once per process; see repro.invalidate_git_cache.
+    """
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -52,6 +66,9 @@ def compute_run_id(
     }
 
     canonical = _canonicalize(payload)
+    # Always SHA-256, unlike content_digest: run ids must match across
+    # environments and past runs, and the payload is too short for the
+    # hash to matter
     return hashlib.sha256(canonical.encode()).hexdigest()[:12]
 
 
@@ -63,3 +80,34 @@ def compute_dataset_id(
 ) -> str:
     """Compute dataset identifier string."""
     return f"{name}:{version}:{split}:{content_hash[:8]}"
+
+
+def content_digest(*chunks: Any) -> str:
+    """Hex digest of file content (bytes or buffers such as mmap) for cache keys.
+
+    SHA-256 by default; OpenSSL uses the CPU's SHA extensions where present.
+    Set ``MMEVALLAB_HASH`` to ``blake3`` or ``xxh3`` for a faster
+    non-cryptographic digest. Switching backends changes every cache key.
+    """
+    algo = os.environ.get(CONTENT_HASH_ENV, "sha256")
+    h: Any
+    if algo == "sha256":
+        h = hashlib.sha256()
+    elif algo == "blake3":
+        try:
+            import blake3
+        except ImportError as e:
+            raise ImportError("Install blake3: pip install blake3") from e
+        h = blake3.blake3()
+    elif algo == "xxh3":
+        try:
+            import xxhash
+        except ImportError as e:
+            raise ImportError("Install xxhash: pip install xxhash") from e
+        h = xxhash.xxh3_128()
+    else:
+        raise ValueError(f"Unknown {CONTENT_HASH_ENV}: {algo}. Valid: sha256, blake3, xxh3")
+
+    for chunk in chunks:
+        h.update(chunk)
+    return str(h.hexdigest())
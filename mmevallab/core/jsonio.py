@@ -0,0 +1,84 @@
+"""JSON encode/decode helpers backed by orjson when available."""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+from collections.abc import Iterator
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the fast extra
+    orjson = None  # type: ignore[assignment]
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document (one JSONL line, or a whole file's bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Encode an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dump(obj: Any, fp: IO[bytes], *, indent: bool = False) -> None:
+    """Write an object as UTF-8 JSON to a binary file.
+
+    Without orjson the stdlib encoder streams chunks straight into ``fp``
+    rather than building the whole document as one string first.
+    """
+    if orjson is not None:
+        fp.write(dumps(obj, indent=indent))
+        return
+    text = io.TextIOWrapper(fp, encoding="utf-8")
+    if indent:
+        json.dump(obj, text, indent=2, ensure_ascii=False)
+    else:
+        json.dump(obj, text, separators=(",", ":"), ensure_ascii=False)
+    text.detach()
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    """Index of the first non-whitespace character at or after pos."""
+    match = _WS.match(text, pos)
+    return match.end() if match else pos
+
+
+def iter_array(text: str) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array one at a time.
+
+    Elements are parsed only as they are consumed, so a caller that stops
+    early never pays for parsing the rest of the document.
+    """
+    decoder = json.JSONDecoder()
+    pos = _skip_ws(text, 0)
+    if not text.startswith("[", pos):
+        raise json.JSONDecodeError("Expecting '['", text, pos)
+    pos = _skip_ws(text, pos + 1)
+    if text.startswith("]", pos):
+        return
+    while True:
+        item, pos = decoder.raw_decode(text, pos)
+        yield item
+        pos = _skip_ws(text, pos)
+        if text.startswith("]", pos):
+            return
+        if not text.startswith(",", pos):
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = _skip_ws(text, pos + 1)
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import string
 from typing import Any
 
 
+@functools.lru_cache(maxsize=256)
 def _compute_template_hash(template: str) -> str:
     """Compute hash of template for reproducibility tracking."""
     return hashlib.sha256(template.encode()).hexdigest()[:8]
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a template into (literal, field name) segments.
+
+    Returns None if any field has a format spec, a conversion, or an index
+    or attribute lookup, which only str.format handles.
+    """
+    segments = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        if name is not None and (spec or conversion or not name.isidentifier()):
+            return None
+        segments.append((literal, name))
+    return tuple(segments)
+
+
 class PromptTemplate:
     """A versioned prompt template."""
 
@@ -19,10 +37,22 @@ class PromptTemplate:
         self.version = version
         self.template = template
         self.hash = _compute_template_hash(template)
+        self._segments = _compile_template(template)
 
     def format(self, **kwargs: Any) -> str:
-        """Format the template with provided values."""
-        return self.template.format(**kwargs)
+        """Format the template with provided values.
+
+        Templates with only plain ``{name}`` fields are joined from segments
+        parsed once at construction, skipping str.format's per-call parse.
+        """
+        if self._segments is None:
+            return self.template.format(**kwargs)
+        parts = []
+        for literal, name in self._segments:
+            parts.append(literal)
+            if name is not None:
+                parts.append(format(kwargs[name]))
+        return "".join(parts)
 
     def __repr__(self) -> str:
         return f"PromptTemplate({self.name}:{self.version}, hash={self.hash})"
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from typing import Any, Callable, Generic, TypeVar
 
 from mmevallab.core.datamodel import Example, Prediction
@@ -30,6 +30,16 @@ class Benchmark(ABC):
         """Score a single prediction against ground truth."""
         ...
 
+    def score_batch(
+        self, examples: Sequence[Example], predictions: Sequence[Prediction]
+    ) -> list[dict[str, Any]]:
+        """Score aligned examples and predictions.
+
+        Defaults to calling score() per pair; adapters may override with a
+        vectorized implementation that returns the same per-example dicts.
+        """
+        return [self.score(ex, pred) for ex, pred in zip(examples, predictions)]
+
 
 class ModelRunner(ABC):
     """Base class for model runners."""
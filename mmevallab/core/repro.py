@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import subprocess
@@ -10,6 +11,8 @@ from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
 
+from mmevallab.core.hashing import get_code_version
+
 
 @dataclass
 class ReproMetadata:
@@ -27,21 +30,48 @@ class ReproMetadata:
         return asdict(self)
 
 
-def capture_repro_metadata(env_prefix: str = "MMEVAL_") -> ReproMetadata:
-    """Capture current reproducibility metadata."""
-    meta = ReproMetadata()
-
-    # Git info
+@functools.lru_cache(maxsize=1)
+def _git_commit() -> str | None:
+    """Full HEAD commit hash, or None outside a git repo."""
     try:
-        meta.git_commit = subprocess.check_output(
+        return subprocess.check_output(
             ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
         ).strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _git_dirty() -> bool:
+    """Whether the working tree has uncommitted changes."""
+    try:
         status = subprocess.check_output(
             ["git", "status", "--porcelain"], stderr=subprocess.DEVNULL, text=True
         )
-        meta.git_dirty = bool(status.strip())
     except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+        return False
+    return bool(status.strip())
+
+
+def invalidate_git_cache() -> None:
+    """Forget the git state probed so far in this process.
+
+    Git is probed once per process, for the working directory at the time;
+    call this after a checkout, commit, or chdir to probe again.
+    """
+    _git_commit.cache_clear()
+    _git_dirty.cache_clear()
+    get_code_version.cache_clear()
+
+
+def capture_repro_metadata(env_prefix: str = "MMEVAL_") -> ReproMetadata:
+    """Capture current reproducibility metadata."""
+    meta = ReproMetadata()
+
+    # Git info
+    meta.git_commit = _git_commit()
+    if meta.git_commit is not None:
+        meta.git_dirty = _git_dirty()
 
     # Relevant env vars
     meta.env_vars = {k: v for k, v in os.environ.items() if k.startswith(env_prefix)}
@@ -89,3 +89,17 @@ class RunArtifact(BaseModel):
     metadata: RunMetadata
     metrics: RunMetrics
     outputs: list[ExampleOutput] = Field(default_factory=list)
+
+    @classmethod
+    def build_trusted(
+        cls,
+        metadata: RunMetadata,
+        metrics: RunMetrics,
+        outputs: list[ExampleOutput],
+    ) -> RunArtifact:
+        """Assemble an artifact from already-validated parts without revalidating.
+
+        ``outputs`` is used as is rather than copied. Use the constructor or
+        ``model_validate`` for artifacts read back from disk.
+        """
+        return cls.model_construct(metadata=metadata, metrics=metrics, outputs=outputs)
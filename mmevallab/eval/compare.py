@@ -6,24 +6,28 @@ import json
 from pathlib import Path
 from typing import Any
 
+from mmevallab.core import jsonio
+
 
 def load_run_metrics(run_dir: Path | str) -> dict[str, Any]:
     """Load metrics from a run directory."""
     run_dir = Path(run_dir)
     metrics_path = run_dir / "metrics.json"
-    with open(metrics_path) as f:
-        return json.load(f)
+    with open(metrics_path, "rb") as f:
+        metrics: dict[str, Any] = jsonio.loads(f.read())
+    return metrics
 
 
 def load_run_predictions(run_dir: Path | str) -> list[dict[str, Any]]:
-    """Load predictions from a run directory."""
+    """Load predictions from a run directory.
+
+    Lines are decoded as raw bytes into plain dicts, since comparison only
+    reads a few keys of each prediction.
+    """
     run_dir = Path(run_dir)
     predictions_path = run_dir / "predictions.jsonl"
-    predictions = []
-    with open(predictions_path) as f:
-        for line in f:
-            predictions.append(json.loads(line))
-    return predictions
+    with open(predictions_path, "rb", buffering=1 << 20) as f:
+        return [jsonio.loads(line) for line in f]
 
 
 def compare_runs(
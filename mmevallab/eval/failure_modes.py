@@ -4,20 +4,40 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 
-class FailureMode(str, Enum):
-    """Failure mode taxonomy."""
-
-    CORRECT = "correct"
-    WRONG_OPTION = "wrong_option"
-    REFUSAL = "refusal"
-    HALLUCINATION = "hallucination"
-    FORMAT_ERROR = "format_error"
-    EMPTY = "empty"
-    UNKNOWN = "unknown"
+class FailureMode(IntEnum):
+    """Failure mode taxonomy.
+
+    Members are small ordinals so label arrays can be counted with
+    np.bincount; ``label`` is the string used in reports.
+    """
+
+    CORRECT = 0
+    WRONG_OPTION = 1
+    REFUSAL = 2
+    HALLUCINATION = 3
+    FORMAT_ERROR = 4
+    EMPTY = 5
+    UNKNOWN = 6
+
+    @property
+    def label(self) -> str:
+        """Human-readable mode name."""
+        return _LABELS[self]
+
+
+_LABELS = {
+    FailureMode.CORRECT: "correct",
+    FailureMode.WRONG_OPTION: "wrong_option",
+    FailureMode.REFUSAL: "refusal",
+    FailureMode.HALLUCINATION: "hallucination",
+    FailureMode.FORMAT_ERROR: "format_error",
+    FailureMode.EMPTY: "empty",
+    FailureMode.UNKNOWN: "unknown",
+}
 
 
 @dataclass
@@ -83,21 +83,20 @@ def run_evaluation(
         output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Run inference and scoring
+    # Run inference
+    outputs = [model.generate(example) for example in examples]
+
+    # Score (unless predict_only)
+    if predict_only:
+        results: list[dict[str, Any]] = [{} for _ in examples]
+    else:
+        results = benchmark.score_batch(examples, outputs)
+
     predictions: list[dict[str, Any]] = []
     correct = 0
     total = 0
 
-    for example in examples:
-        # Generate prediction
-        prediction = model.generate(example)
-
-        # Score (unless predict_only)
-        if predict_only:
-            result: dict[str, Any] = {}
-        else:
-            result = benchmark.score(example, prediction)
-
+    for example, prediction, result in zip(examples, outputs, results):
         # Record
         pred_record = {
             "example_id": example.example_id,
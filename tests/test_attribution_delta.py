@@ -0,0 +1,169 @@
+"""Tests for run delta canonicalization."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mmevallab.attribution.delta import (
+    OUTCOMES_SIDECAR,
+    Direction,
+    canonicalize_run_delta,
+    compute_delta_index,
+    compute_example_deltas,
+    compute_slice_deltas,
+    index_example_deltas,
+    load_outcomes,
+)
+
+
+def _write_run(run_dir: Path, outcomes: dict[str, bool | None]) -> Path:
+    run_dir.mkdir()
+    with open(run_dir / "predictions.jsonl", "w") as f:
+        for eid, is_correct in outcomes.items():
+            f.write(json.dumps({"example_id": eid, "is_correct": is_correct}) + "\n")
+    return run_dir
+
+
+@pytest.fixture
+def runs(tmp_path: Path) -> tuple[Path, Path]:
+    run1 = _write_run(
+        tmp_path / "run1",
+        {"e1": True, "e2": False, "e3": None, "e4": True, "e5": False},
+    )
+    run2 = _write_run(
+        tmp_path / "run2",
+        {"e1": False, "e2": True, "e3": True, "e4": True, "e6": True},
+    )
+    return run1, run2
+
+
+class TestExampleDeltas:
+    """Tests for per-example deltas."""
+
+    def test_directions(self, runs: tuple[Path, Path]) -> None:
+        deltas = {d.example_id: d for d in compute_example_deltas(*runs)}
+        assert set(deltas) == {"e1", "e2", "e3", "e4", "e5", "e6"}
+        assert deltas["e1"].direction == Direction.REGRESSED
+        assert deltas["e2"].direction == Direction.IMPROVED
+        assert deltas["e3"].direction == Direction.UNCHANGED
+        assert deltas["e4"].direction == Direction.UNCHANGED
+
+    def test_missing_side_is_none(self, runs: tuple[Path, Path]) -> None:
+        deltas = {d.example_id: d for d in compute_example_deltas(*runs)}
+        assert deltas["e5"].run2_correct is None
+        assert deltas["e5"].changed
+        assert deltas["e6"].run1_correct is None
+        assert not deltas["e4"].changed
+
+
+class TestOutcomeSidecar:
+    """Tests for the cached outcome arrays."""
+
+    def test_sidecar_written_and_reused(self, runs: tuple[Path, Path]) -> None:
+        run1, _ = runs
+        ids, codes = load_outcomes(run1)
+        assert (run1 / OUTCOMES_SIDECAR).exists()
+        cached_ids, cached_codes = load_outcomes(run1)
+        assert cached_ids.tolist() == ids.tolist() == ["e1", "e2", "e3", "e4", "e5"]
+        assert cached_codes.tolist() == codes.tolist() == [2, 1, 0, 2, 1]
+
+    def test_stale_sidecar_ignored(self, runs: tuple[Path, Path]) -> None:
+        run1, _ = runs
+        load_outcomes(run1)
+        sidecar_mtime = (run1 / OUTCOMES_SIDECAR).stat().st_mtime_ns
+        with open(run1 / "predictions.jsonl", "w") as f:
+            f.write(json.dumps({"example_id": "e9", "is_correct": True}) + "\n")
+        os.utime(run1 / "predictions.jsonl", ns=(sidecar_mtime + 1, sidecar_mtime + 1))
+        ids, codes = load_outcomes(run1)
+        assert ids.tolist() == ["e9"]
+        assert codes.tolist() == [2]
+
+    def test_rewrite_with_restored_mtime_detected(self, runs: tuple[Path, Path]) -> None:
+        run1, _ = runs
+        load_outcomes(run1)
+        st = (run1 / "predictions.jsonl").stat()
+        with open(run1 / "predictions.jsonl", "w") as f:
+            f.write(json.dumps({"example_id": "e9", "is_correct": True}) + "\n")
+        os.utime(run1 / "predictions.jsonl", ns=(st.st_atime_ns, st.st_mtime_ns))
+        ids, codes = load_outcomes(run1)
+        assert ids.tolist() == ["e9"]
+        assert codes.tolist() == [2]
+
+    def test_mtime_preserving_copy_detected(self, runs: tuple[Path, Path]) -> None:
+        run1, _ = runs
+        load_outcomes(run1)
+        old_ns = (run1 / "predictions.jsonl").stat().st_mtime_ns - 10**9
+        outcomes = {"e1": False, "e2": True, "e3": None, "e4": False, "e5": True}
+        with open(run1 / "predictions.jsonl", "w") as f:
+            for eid, is_correct in outcomes.items():
+                f.write(json.dumps({"example_id": eid, "is_correct": is_correct}) + "\n")
+        os.utime(run1 / "predictions.jsonl", ns=(old_ns, old_ns))
+        _, codes = load_outcomes(run1)
+        assert codes.tolist() == [1, 2, 0, 1, 2]
+
+
+class TestCanonicalDelta:
+    """Tests for the canonical delta summary."""
+
+    def test_summary(self, runs: tuple[Path, Path]) -> None:
+        result = canonicalize_run_delta(*runs)
+        assert result["total_examples"] == 6
+        assert result["improved"] == 1
+        assert result["regressed"] == 1
+        assert result["unchanged"] == 4
+        assert result["net_change"] == 0
+        assert result["improved_ids"] == ["e2"]
+        assert result["regressed_ids"] == ["e1"]
+
+
+class TestSliceDeltas:
+    """Tests for per-slice deltas."""
+
+    def test_slice_accuracy(self, runs: tuple[Path, Path]) -> None:
+        deltas = compute_example_deltas(*runs)
+        slices = compute_slice_deltas(deltas, {"s1": ["e1", "e2", "e3"], "s2": ["e4", "e5", "e6"]})
+        by_name = {s.slice_name: s for s in slices}
+        assert by_name["s1"].run1_count == 2
+        assert by_name["s1"].run2_count == 3
+        assert by_name["s1"].run2_accuracy == pytest.approx(2 / 3)
+        assert by_name["s2"].delta == pytest.approx(0.5)
+
+    def test_sorted_by_delta(self, runs: tuple[Path, Path]) -> None:
+        deltas = compute_example_deltas(*runs)
+        slices = compute_slice_deltas(deltas, {"s1": ["e1"], "s2": ["e2"], "empty": []})
+        assert [s.slice_name for s in slices] == ["s1", "empty", "s2"]
+
+    def test_accepts_index(self, runs: tuple[Path, Path]) -> None:
+        deltas = compute_example_deltas(*runs)
+        assignments = {"s1": ["e1", "e2", "e3"], "s2": ["e4", "e5", "e6"]}
+        assert compute_slice_deltas(index_example_deltas(deltas), assignments) == (
+            compute_slice_deltas(deltas, assignments)
+        )
+
+    def test_top_k(self, runs: tuple[Path, Path]) -> None:
+        deltas = compute_example_deltas(*runs)
+        slices = compute_slice_deltas(deltas, {"s1": ["e1"], "s2": ["e2"], "empty": []}, top_k=2)
+        assert [s.slice_name for s in slices] == ["s1", "empty"]
+
+    def test_thread_pool_matches_serial(self, runs: tuple[Path, Path]) -> None:
+        deltas = compute_example_deltas(*runs)
+        assignments = {"s1": ["e1", "e2", "e3"], "s2": ["e4", "e5", "e6", "missing"]}
+        assert compute_slice_deltas(deltas, assignments, max_workers=2) == (
+            compute_slice_deltas(deltas, assignments)
+        )
+
+    def test_computed_index_matches_built_index(self, runs: tuple[Path, Path]) -> None:
+        index = compute_delta_index(*runs)
+        assert index.improved_ids == ["e2"]
+        assert index.regressed_ids == ["e1"]
+        assignments = {"s1": ["e1", "e2", "e3"], "s2": ["e4", "e5", "e6"]}
+        assert compute_slice_deltas(index, assignments) == (
+            compute_slice_deltas(index_example_deltas(compute_example_deltas(*runs)), assignments)
+        )
+
+    def test_unsorted_keeps_assignment_order(self, runs: tuple[Path, Path]) -> None:
+        deltas = compute_example_deltas(*runs)
+        slices = compute_slice_deltas(deltas, {"s2": ["e2"], "s1": ["e1"]}, sort=False)
+        assert [s.slice_name for s in slices] == ["s2", "s1"]
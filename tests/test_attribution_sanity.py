@@ -30,6 +30,15 @@ class TestSelfAttribution:
         assert not result.passed
         assert "1" in result.message
 
+    def test_reported_violations_capped(self) -> None:
+        attrs = {
+            f"test{i}": [Attribution(f"test{i}", f"test{i + 1}", 0.9, "jaccard")] for i in range(25)
+        }
+        result = check_self_attribution(attrs, {f"test{i}" for i in range(26)})
+        assert result.message == "Found 25 self-attributions"
+        assert result.details is not None
+        assert len(result.details["violations"]) == 10
+
 
 class TestCoverage:
     """Tests for attribution coverage check."""
@@ -0,0 +1,31 @@
+"""Tests for the CLI command group."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from mmevallab.cli import _COMMANDS, main
+
+
+class TestLazyCommands:
+    """Tests for lazily loaded subcommands."""
+
+    def test_help_lists_all_commands(self) -> None:
+        result = CliRunner().invoke(main, ["--help"])
+        assert result.exit_code == 0
+        for name in _COMMANDS:
+            assert name in result.output
+
+    def test_invoking_imports_only_that_command(self, tmp_path: Path) -> None:
+        code = (
+            "import sys\n"
+            "from mmevallab.cli import main\n"
+            f"main(['slices', {str(tmp_path)!r}], standalone_mode=False)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('mmevallab.cli.')))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.splitlines()[-1] == "['mmevallab.cli._cmd_slices']"
@@ -0,0 +1,153 @@
+"""Tests for text fingerprinting."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mmevallab.contamination import scanner
+from mmevallab.contamination.fingerprint import (
+    TextFingerprintIndex,
+    compute_ngram_hashes,
+    normalize_text,
+)
+
+
+class TestNormalizeText:
+    """Tests for fingerprint normalization."""
+
+    def test_ascii(self) -> None:
+        assert normalize_text("  Hello,\tWorld!  ") == "hello world"
+        assert normalize_text("snake_case - x -") == "snake_case  x "
+
+    def test_unicode(self) -> None:
+        assert normalize_text("Café — ﬁne") == "café  fine"
+
+
+class TestNgramHashes:
+    """Tests for n-gram hashing."""
+
+    def test_independent_of_hash_seed(self) -> None:
+        code = (
+            "from mmevallab.contamination.fingerprint import compute_ngram_hashes;"
+            "print(sorted(compute_ngram_hashes('one two three four five six')))"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert outputs == {f"{sorted(compute_ngram_hashes('one two three four five six'))}\n"}
+
+
+class TestTextFingerprintIndex:
+    """Tests for exact and near-duplicate lookup."""
+
+    TEXT = "the quick brown fox jumps over the lazy dog again and again"
+
+    def test_exact(self) -> None:
+        index = TextFingerprintIndex()
+        index.add("a", self.TEXT)
+        assert index.find_exact(self.TEXT.upper()) == ["a"]
+        assert index.find_exact("something else") == []
+
+    def test_near_after_incremental_adds(self) -> None:
+        index = TextFingerprintIndex()
+        index.add("a", self.TEXT)
+        assert index.find_near(self.TEXT) == [("a", 1.0)]
+        words = self.TEXT.split()
+        index.add("b", " ".join(words[:8] + ["cat"] * 4))
+        index.add("c", "completely unrelated words in this sample text")
+        results = index.find_near(self.TEXT, threshold=0.3)
+        assert [sample_id for sample_id, _ in results] == ["a", "b"]
+        assert results[1][1] == 0.5
+        assert index.find_near(" ".join(words[:6] + ["cat"] * 6), threshold=0.5) == []
+
+    def test_ties_keep_insertion_order(self) -> None:
+        index = TextFingerprintIndex()
+        for sample_id in ("z", "y", "x"):
+            index.add(sample_id, self.TEXT)
+        assert [s for s, _ in index.find_near(self.TEXT)] == ["z", "y", "x"]
+
+    def test_no_ngram_overlap(self) -> None:
+        index = TextFingerprintIndex()
+        index.add("a", self.TEXT)
+        assert index.find_near("entirely different text with many other words", 0.0) == []
+
+    def test_save_load_round_trip(self, tmp_path: Path) -> None:
+        index = TextFingerprintIndex()
+        words = self.TEXT.split()
+        index.add("a", self.TEXT)
+        index.add("b", " ".join(words[:8] + ["cat"] * 4))
+        index.add("a", "short text")
+        index.save(tmp_path / "index")
+
+        for mmap in (True, False):
+            loaded = TextFingerprintIndex.load(tmp_path / "index", mmap=mmap)
+            assert len(loaded) == len(index) == 3
+            assert loaded.find_exact("Short text!") == ["a"]
+            assert loaded.find_near(self.TEXT, 0.3) == index.find_near(self.TEXT, 0.3)
+
+        loaded.add("c", self.TEXT)
+        loaded.add("b", self.TEXT)
+        assert loaded.find_exact(self.TEXT) == ["a", "c", "b"]
+        assert loaded.find_near("short text") == [("a", 1.0)]
+        loaded.save(tmp_path / "index")
+        assert TextFingerprintIndex.load(tmp_path / "index").find_exact(self.TEXT) == [
+            "a",
+            "c",
+            "b",
+        ]
+
+    def test_load_rejects_other_format(self, tmp_path: Path) -> None:
+        TextFingerprintIndex().save(tmp_path / "index")
+        (tmp_path / "index" / "meta.json").write_text('{"format": 0}')
+        with pytest.raises(ValueError):
+            TextFingerprintIndex.load(tmp_path / "index")
+
+
+class TestBuildTrainingIndex:
+    """Tests for building the index from a training manifest."""
+
+    WORDS = "alpha beta gamma delta epsilon zeta eta theta iota kappa".split()
+
+    def _write_manifest(self, path: Path) -> Path:
+        with open(path, "w") as f:
+            for i in range(10):
+                text = " ".join(self.WORDS[i:] + self.WORDS[:i]) if i % 4 else ""
+                f.write(json.dumps({"sample_id": f"s{i}", "modality": "text", "text": text}) + "\n")
+        return path
+
+    def test_process_pool_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(scanner, "_INDEX_BATCH_SIZE", 3)
+        manifest = self._write_manifest(tmp_path / "train.jsonl")
+
+        serial = scanner.build_training_index(manifest)
+        parallel = scanner.build_training_index(manifest, max_workers=2)
+        query = " ".join(self.WORDS)
+        assert parallel.find_exact(query) == serial.find_exact(query)
+        assert parallel.find_near(query, threshold=0.0) == serial.find_near(query, threshold=0.0)
+        assert len(serial.find_near(query, threshold=0.0)) == 7
+
+    def test_cache_reused(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        manifest = self._write_manifest(tmp_path / "train.jsonl")
+        built = scanner.build_training_index(manifest, cache_dir=tmp_path / "cache")
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        def fail(*args: object) -> None:
+            raise AssertionError("index rebuilt")
+
+        monkeypatch.setattr(scanner, "_build_training_index", fail)
+        cached = scanner.build_training_index(manifest, cache_dir=tmp_path / "cache")
+        query = " ".join(self.WORDS)
+        assert cached.find_near(query, threshold=0.0) == built.find_near(query, threshold=0.0)
@@ -1,6 +1,19 @@
 """Tests for deterministic run-id hashing."""
 
-from mmevallab.core.hashing import compute_dataset_id, compute_run_id
+import hashlib
+import subprocess
+from typing import Any
+
+import pytest
+
+from mmevallab.core.hashing import (
+    CONTENT_HASH_ENV,
+    compute_dataset_id,
+    compute_run_id,
+    content_digest,
+    get_code_version,
+)
+from mmevallab.core.repro import capture_repro_metadata, invalidate_git_cache
 
 
 def test_run_id_deterministic() -> None:
@@ -44,3 +57,52 @@ def test_dataset_id_format() -> None:
     """Dataset ID should have expected format."""
     did = compute_dataset_id("MMMU", "1.0", "val", "abc123456789")
     assert did == "MMMU:1.0:val:abc12345"
+
+
+def test_content_digest_defaults_to_sha256(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Content digest should be SHA-256 over the concatenated chunks by default."""
+    monkeypatch.delenv(CONTENT_HASH_ENV, raising=False)
+    assert content_digest(b"head", b"tail") == hashlib.sha256(b"headtail").hexdigest()
+
+
+def test_content_digest_unknown_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unknown hash backends should be rejected."""
+    monkeypatch.setenv(CONTENT_HASH_ENV, "md4")
+    with pytest.raises(ValueError):
+        content_digest(b"data")
+
+
+def test_git_probed_once_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Git should be shelled out to once until the cache is invalidated."""
+    calls: list[list[str]] = []
+    real_run = subprocess.run
+    real_check_output = subprocess.check_output
+
+    def fake_run(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        if args[0] != "git":
+            return real_run(args, **kwargs)
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="0123456789abcdef\n")
+
+    def fake_check_output(args: list[str], **kwargs: Any) -> Any:
+        if args[0] != "git":
+            return real_check_output(args, **kwargs)
+        calls.append(args)
+        return "0123456789abcdef\n" if args[1] == "rev-parse" else " M file.py\n"
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "check_output", fake_check_output)
+    invalidate_git_cache()
+    try:
+        assert get_code_version() == get_code_version() == "0123456789ab"
+        for _ in range(2):
+            meta = capture_repro_metadata()
+            assert meta.git_commit == "0123456789abcdef"
+            assert meta.git_dirty
+        assert len(calls) == 3
+
+        invalidate_git_cache()
+        get_code_version()
+        assert len(calls) == 4
+    finally:
+        invalidate_git_cache()
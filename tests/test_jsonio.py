@@ -0,0 +1,32 @@
+"""Tests for JSON helpers."""
+
+import json
+
+import pytest
+
+from mmevallab.core.jsonio import iter_array
+
+
+class TestIterArray:
+    """Tests for incremental array decoding."""
+
+    def test_matches_full_decode(self) -> None:
+        text = json.dumps([{"a": 1}, [2, 3], "x", None, 1.5], indent=2)
+        assert list(iter_array(text)) == json.loads(text)
+
+    def test_empty_array(self) -> None:
+        assert list(iter_array(" [ ] ")) == []
+
+    def test_stops_before_malformed_tail(self) -> None:
+        items = iter_array('[1, 2, {"broken": ')
+        assert [next(items), next(items)] == [1, 2]
+        with pytest.raises(json.JSONDecodeError):
+            next(items)
+
+    def test_not_an_array(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_array('{"a": 1}'))
+
+    def test_missing_delimiter(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_array("[1 2]"))
@@ -0,0 +1,39 @@
+"""Tests for training manifest loading."""
+
+from pathlib import Path
+
+import pytest
+
+from mmevallab.contamination.manifest import load_manifest, load_manifest_parquet
+
+
+class TestParquetManifest:
+    """Tests for the Parquet manifest engines."""
+
+    def test_pyarrow_matches_pandas(self, tmp_path: Path) -> None:
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        pytest.importorskip("pandas")
+
+        table = pa.table(
+            {
+                "sample_id": ["s1", "s2", "s3"],
+                "modality": ["text", "image", "text"],
+                "text": ["first sample", None, "third sample"],
+                "image_ref": [None, "img/2.png", None],
+                "source": ["web", "web", None],
+            }
+        )
+        path = tmp_path / "train.parquet"
+        pq.write_table(table, path, row_group_size=2)
+
+        samples = list(load_manifest(path))
+        assert samples == list(load_manifest_parquet(path, engine="pandas"))
+        assert [s.sample_id for s in samples] == ["s1", "s2", "s3"]
+        assert samples[1].text is None
+        assert samples[1].image_ref == "img/2.png"
+        assert samples[2].video_ref is None
+
+    def test_unknown_engine(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            list(load_manifest_parquet(tmp_path / "train.parquet", engine="polars"))
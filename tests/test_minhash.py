@@ -0,0 +1,59 @@
+"""Tests for MinHash signatures."""
+
+import random
+import subprocess
+import sys
+
+import pytest
+
+from mmevallab.contamination.minhash import LSHIndex, MinHash
+
+
+def _text(seed: int, n_words: int = 200) -> str:
+    rng = random.Random(seed)
+    return " ".join(f"w{rng.randrange(400)}" for _ in range(n_words))
+
+
+class TestMinHash:
+    """Tests for MinHash signatures."""
+
+    def test_identical_texts(self) -> None:
+        text = _text(0)
+        assert MinHash().compute(text).jaccard(MinHash().compute(text)) == 1.0
+
+    def test_empty_text(self) -> None:
+        assert MinHash(num_hashes=4).compute("too short").signature.tolist() == [0, 0, 0, 0]
+
+    def test_estimates_jaccard(self) -> None:
+        words = _text(1).split()
+        a, b = " ".join(words), " ".join(words[:120] + _text(2, 80).split())
+        shingles_a = {" ".join(words[i : i + 5]) for i in range(len(words) - 4)}
+        words_b = b.split()
+        shingles_b = {" ".join(words_b[i : i + 5]) for i in range(len(words_b) - 4)}
+        true = len(shingles_a & shingles_b) / len(shingles_a | shingles_b)
+        est = MinHash(num_hashes=256).compute(a).jaccard(MinHash(num_hashes=256).compute(b))
+        assert est == pytest.approx(true, abs=0.1)
+
+    def test_signature_stable_across_processes(self) -> None:
+        code = (
+            "from mmevallab.contamination.minhash import MinHash\n"
+            "print(MinHash(num_hashes=8).compute('a b c d e f g').signature.tolist())\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        assert out == str(MinHash(num_hashes=8).compute("a b c d e f g").signature.tolist())
+
+
+class TestLSHIndex:
+    """Tests for banded LSH lookup."""
+
+    def test_query_finds_near_duplicate(self) -> None:
+        index = LSHIndex()
+        for seed in range(20):
+            index.add(f"doc{seed}", MinHash().compute(_text(seed)))
+        words = _text(3).split()
+        query = MinHash().compute(" ".join(words[:190] + ["novel"] * 10))
+        results = index.query(query, threshold=0.5)
+        assert [doc_id for doc_id, _ in results] == ["doc3"]
+        assert results[0][1] > 0.8
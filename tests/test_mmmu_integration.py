@@ -49,3 +49,60 @@ class TestMMMUIntegration:
         pred = model.generate(example)
         assert pred.example_id == "test1"
         assert pred.extracted_answer == "6"
+
+    def test_media_ref_lazy_load(self) -> None:
+        """Test that deferred media loads on demand and is not serialized."""
+        from mmevallab.core.datamodel import MediaRef
+
+        calls = []
+        ref = MediaRef(type="image", loader=lambda: calls.append(1) or "pixels")
+        assert calls == []
+        assert ref.load() == "pixels"
+        assert "loader" not in ref.model_dump()
+        with pytest.raises(ValueError):
+            MediaRef(type="image").load()
+
+    def test_score_batch_matches_score(self) -> None:
+        """Test that batched MMMU scoring matches per-example scoring."""
+        import mmevallab.benchmarks  # noqa: F401
+        from mmevallab.core.datamodel import Example, Prediction
+
+        benchmark = benchmark_registry.create("mmmu")
+        examples = [
+            Example(example_id="e1", ground_truth="B"),
+            Example(example_id="e2", ground_truth=" c "),
+            Example(example_id="e3", ground_truth=None),
+            Example(example_id="e4", ground_truth="A"),
+            Example(example_id="e5", ground_truth="ß"),
+            Example(example_id="e6", ground_truth="A\x00"),
+        ]
+        predictions = [
+            Prediction(example_id="e1", raw_output="", extracted_answer="b ", latency_ms=1.0),
+            Prediction(example_id="e2", raw_output="", extracted_answer="D", latency_ms=1.0),
+            Prediction(example_id="e3", raw_output="", extracted_answer="A", latency_ms=1.0),
+            Prediction(example_id="e4", raw_output="", extracted_answer=None, latency_ms=1.0),
+            Prediction(example_id="e5", raw_output="", extracted_answer="SS", latency_ms=1.0),
+            Prediction(example_id="e6", raw_output="", extracted_answer="A", latency_ms=1.0),
+        ]
+        expected = [benchmark.score(e, p) for e, p in zip(examples, predictions)]
+        assert [r["is_correct"] for r in expected[4:]] == [True, False]
+        assert benchmark.score_batch(examples, predictions) == expected
+        assert benchmark.score_batch([], []) == []
+
+    def test_image_columns_load_independently(self) -> None:
+        """Test that each deferred image reads only its own column."""
+        datasets = pytest.importorskip("datasets")
+        pil_image = pytest.importorskip("PIL.Image")
+        from mmevallab.benchmarks.mmmu import _compute_content_hash, _iter_rows, _load_image
+
+        images = [pil_image.new("RGB", (2, 2), color) for color in ("red", "blue")]
+        ds = datasets.Dataset.from_dict(
+            {"id": ["q2", "q1"], "image_1": images, "image_2": [None, images[0]]}
+        ).cast_column("image_1", datasets.Image())
+
+        rows = list(_iter_rows([ds]))
+        image_columns, row, item = rows[1]
+        assert set(image_columns) == {"image_1", "image_2"}
+        assert image_columns["image_1"].column_names == ["image_1"]
+        assert _load_image(image_columns["image_1"], row, "image_1").getpixel((0, 0)) == (0, 0, 255)
+        assert _compute_content_hash([ds]) == _compute_content_hash([ds.select([1, 0])])
@@ -6,6 +6,7 @@ from mmevallab.benchmarks.omnidoc_schema import (
     BoundingBox,
     OmniDocAnnotation,
     parse_omnidoc_annotation,
+    parse_omnidoc_dataset,
     validate_omnidoc_schema,
 )
 from mmevallab.eval.omnidoc_metrics import compute_edit_similarity, compute_teds
@@ -58,6 +59,24 @@ class TestOmniDocSchema:
         with pytest.raises(ValueError):
             parse_omnidoc_annotation(data)
 
+    def test_parse_dataset(self) -> None:
+        data = [
+            {"doc_id": "doc1", "page_num": 1, "pdf_name": "doc1.pdf"},
+            {"doc_id": "doc2", "page_num": 3, "pdf_name": "doc2.pdf", "has_table": True},
+        ]
+        dataset = parse_omnidoc_dataset(data, split="val")
+        assert dataset.split == "val"
+        assert dataset.num_examples == 2
+        assert dataset.annotations[1].has_table is True
+
+    def test_parse_dataset_invalid_item(self) -> None:
+        data = [
+            {"doc_id": "doc1", "page_num": 1, "pdf_name": "doc1.pdf"},
+            {"doc_id": "doc2", "page_num": 0, "pdf_name": "doc2.pdf"},
+        ]
+        with pytest.raises(ValueError):
+            parse_omnidoc_dataset(data)
+
 
 class TestSchemaValidation:
     """Tests for schema validation."""
@@ -145,3 +164,22 @@ class TestLatexNormalization:
         from mmevallab.benchmarks.omnidocbench import _normalize_latex
 
         assert _normalize_latex("x  +  y") == "x + y"
+
+
+class TestEditDistance:
+    """Tests for Levenshtein edit distance."""
+
+    def test_known_distances(self) -> None:
+        from mmevallab.benchmarks.omnidocbench import _edit_distance
+
+        assert _edit_distance("kitten", "sitting") == 3
+        assert _edit_distance("sitting", "kitten") == 3
+        assert _edit_distance("", "abc") == 3
+        assert _edit_distance("abc", "abc") == 0
+
+    def test_max_edit_band(self) -> None:
+        from mmevallab.benchmarks.omnidocbench import _edit_distance
+
+        assert _edit_distance("kitten", "sitting", max_edit=3) == 3
+        assert _edit_distance("kitten", "sitting", max_edit=2) == 3
+        assert _edit_distance("abcdef", "a", max_edit=2) == 3
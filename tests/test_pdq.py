@@ -0,0 +1,51 @@
+"""Tests for perceptual hash comparison."""
+
+import random
+
+import pytest
+
+from mmevallab.contamination.pdq import PDQIndex, hamming_distance, pdq_similarity
+
+
+class TestHammingDistance:
+    """Tests for bitwise hash distance."""
+
+    def test_counts_bits(self) -> None:
+        assert hamming_distance("00", "00") == 0
+        assert hamming_distance("0f", "00") == 4
+        assert hamming_distance("ff", "00") == 8
+        assert hamming_distance("80", "01") == 2
+
+    def test_length_mismatch(self) -> None:
+        with pytest.raises(ValueError):
+            hamming_distance("00", "000")
+
+    def test_similarity(self) -> None:
+        assert pdq_similarity("ff", "ff") == 1.0
+        assert pdq_similarity("ff", "00") == 0.0
+        assert pdq_similarity("0f", "00") == pytest.approx(0.5)
+
+
+class TestPDQIndex:
+    """Tests for the BK-tree hash index."""
+
+    def test_matches_linear_scan(self) -> None:
+        rng = random.Random(0)
+        hashes = {f"h{i}": f"{rng.getrandbits(16):04x}" for i in range(300)}
+        hashes["dup"] = hashes["h0"]
+        index = PDQIndex()
+        for item_id, h in hashes.items():
+            index.add(item_id, h)
+        assert len(index) == 301
+        for query in ("0000", hashes["h0"], "beef"):
+            expected = {
+                (item_id, hamming_distance(h, query))
+                for item_id, h in hashes.items()
+                if hamming_distance(h, query) <= 3
+            }
+            results = index.query(query, max_dist=3)
+            assert set(results) == expected
+            assert [d for _, d in results] == sorted(d for _, d in results)
+
+    def test_empty(self) -> None:
+        assert PDQIndex().query("00", max_dist=8) == []
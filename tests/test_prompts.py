@@ -0,0 +1,26 @@
+"""Tests for prompt templates."""
+
+import pytest
+
+from mmevallab.core.prompts import MMMU_V1_TEMPLATE, PromptTemplate, format_mmmu_prompt
+
+
+class TestPromptTemplate:
+    """Tests for template formatting."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [MMMU_V1_TEMPLATE, "{{literal}} {question}{question}}}", "no fields", "{question!r:>40}"],
+    )
+    def test_matches_str_format(self, template: str) -> None:
+        values = {"question": "What is 2 + 2?", "options": "A. 3\nB. 4"}
+        assert PromptTemplate("t", "v1", template).format(**values) == template.format(**values)
+
+    def test_missing_field(self) -> None:
+        with pytest.raises(KeyError):
+            PromptTemplate("t", "v1", "{question}").format(options="A. 3")
+
+    def test_format_mmmu_prompt(self) -> None:
+        prompt, template_hash = format_mmmu_prompt("Q?", ["A. 1", "B. 2"])
+        assert prompt == "Q?\n\nA. 1\nB. 2\n\nAnswer with the letter of the correct option."
+        assert len(template_hash) == 8
@@ -0,0 +1,43 @@
+"""Tests for run artifact schemas."""
+
+from datetime import datetime
+
+from mmevallab.core.schema import (
+    DatasetVersion,
+    ExampleOutput,
+    RunArtifact,
+    RunConfig,
+    RunMetadata,
+    RunMetrics,
+)
+
+
+class TestRunArtifact:
+    """Tests for assembling run artifacts."""
+
+    def test_build_trusted_matches_validated(self) -> None:
+        metadata = RunMetadata(
+            run_id="4ef55ffb34ec",
+            created_at=datetime(2024, 1, 1),
+            config=RunConfig(
+                benchmark="mmmu",
+                model="test",
+                split="validation",
+                prompt_template="v1",
+                prompt_template_hash="abcd1234",
+            ),
+            dataset_version=DatasetVersion(
+                name="MMMU", version="1.0", split="validation", num_examples=1, content_hash="c"
+            ),
+            code_version="deadbeef1234",
+            python_version="3.11",
+            package_version="0.1.0",
+        )
+        metrics = RunMetrics(overall_accuracy=1.0, total_examples=1, correct=1)
+        outputs = [ExampleOutput(example_id="e1", raw_output="B", is_correct=True, latency_ms=1.0)]
+
+        artifact = RunArtifact.build_trusted(metadata, metrics, outputs)
+        assert artifact.outputs is outputs
+        validated = RunArtifact(metadata=metadata, metrics=metrics, outputs=outputs)
+        assert artifact.model_dump() == validated.model_dump()
+        assert RunArtifact.model_validate_json(artifact.model_dump_json()) == validated
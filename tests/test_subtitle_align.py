@@ -20,6 +20,12 @@ class TestParseSubtitles:
         assert result[0].end_ms == 1000
         assert result[0].text == "Hello"
 
+    def test_parse_zero_ms_not_overridden(self) -> None:
+        subs = [{"start_ms": 0, "end_ms": 0, "start": 2, "end": 3, "text": "Hi"}]
+        result = parse_subtitles(subs)
+        assert result[0].start_ms == 0
+        assert result[0].end_ms == 0
+
     def test_parse_seconds_format(self) -> None:
         subs = [{"start": 0, "end": 1, "text": "Hello"}]
         result = parse_subtitles(subs)
@@ -88,6 +94,15 @@ class TestFormatSubtitles:
         result = format_subtitles_for_prompt(aligned)
         assert result == "Same\nDifferent"
 
+    def test_deduplication_skips_empty(self) -> None:
+        aligned = [
+            AlignedSubtitle(frame_idx=0, timestamp_ms=0, text="Same"),
+            AlignedSubtitle(frame_idx=1, timestamp_ms=500, text=""),
+            AlignedSubtitle(frame_idx=2, timestamp_ms=1000, text="Same"),
+        ]
+        result = format_subtitles_for_prompt(aligned, include_timestamps=True)
+        assert result == "[0.0s] Same"
+
     def test_empty_subtitles(self) -> None:
         result = format_subtitles_for_prompt([])
         assert result == ""
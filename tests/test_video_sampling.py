@@ -0,0 +1,59 @@
+"""Tests for cached video frame sampling."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mmevallab.benchmarks.video_sampling import (
+    VideoFrameSampler,
+    _compute_video_hash,
+    _get_cache_key,
+)
+
+
+@pytest.fixture
+def video(tmp_path: Path) -> Path:
+    """A short noisy clip, so lossy re-encoding would change pixels."""
+    av = pytest.importorskip("av")
+    pytest.importorskip("PIL")
+    path = tmp_path / "clip.mp4"
+    rng = np.random.default_rng(0)
+    with av.open(str(path), "w") as container:
+        stream = container.add_stream("mpeg4", rate=10)
+        stream.width = stream.height = 64
+        stream.pix_fmt = "yuv420p"
+        for _ in range(20):
+            pixels = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return path
+
+
+class TestVideoFrameCache:
+    """Tests for the frame cache round trip."""
+
+    def test_default_format_is_lossless(self, video: Path, tmp_path: Path) -> None:
+        sampler = VideoFrameSampler(cache_dir=tmp_path / "cache")
+        cold, manifest = sampler.sample_uniform(video, num_frames=4)
+        cache_key = _get_cache_key(_compute_video_hash(video), "uniform", {"num_frames": 4})
+        warm, warm_manifest = sampler._load_cached(cache_key)
+
+        assert len(cold) == len(warm) == manifest.frame_count == 4
+        assert warm_manifest.timestamps_ms == manifest.timestamps_ms
+        for a, b in zip(cold, warm):
+            assert np.array_equal(np.asarray(a), np.asarray(b))
+
+    def test_lossy_entry_not_reused_for_other_format(self, video: Path, tmp_path: Path) -> None:
+        VideoFrameSampler(cache_dir=tmp_path / "cache", cache_format="jpeg").sample_uniform(
+            video, num_frames=4
+        )
+        cold, _ = VideoFrameSampler().sample_uniform(video, num_frames=4)
+        frames, _ = VideoFrameSampler(cache_dir=tmp_path / "cache").sample_uniform(
+            video, num_frames=4
+        )
+        for a, b in zip(cold, frames):
+            assert np.array_equal(np.asarray(a), np.asarray(b))